@@ -21,9 +21,13 @@ class EventBus:
             ]
 
     def emit(self, event_type: str, payload: dict) -> list[Any]:
-        """Emit an event to all registered handlers. Returns list of results."""
+        """Emit an event to all registered handlers. Returns list of results.
+
+        Iterates a snapshot, so handlers may register or unregister
+        (themselves included) mid-dispatch; changes apply from the next emit.
+        """
         results = []
-        for plugin_id, handler in self.handlers[event_type]:
+        for plugin_id, handler in tuple(self.handlers.get(event_type, ())):
             try:
                 result = handler(payload)
                 if result is not None:
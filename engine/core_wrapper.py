@@ -1,8 +1,9 @@
 """Wrapper around the Rust core."""
-import json
 import os
 import sys
 
+from .state import loads
+
 # Try to import the compiled extension
 try:
     # When running from repo root
@@ -57,7 +58,7 @@ class CoreEngine:
         # Get new state back
         new_state_json = state.to_json()
 
-        return new_state_json, json.loads(events_json)
+        return new_state_json, loads(events_json)
 
 class StateManager:
     """Wrapper for Rust GameState."""
@@ -0,0 +1,66 @@
+"""Buffered logging for the tick loop.
+
+Plugins log through get_logger(tag) instead of print(). Records collect in
+a MemoryHandler and go to stdout in batches: when the buffer fills, on an
+error, or when the tick loop calls flush_logs() at the end of a tick.
+Output keeps the "[tag] message" form that print() used.
+"""
+
+import logging
+import sys
+from logging.handlers import MemoryHandler
+
+BUFFER_CAPACITY = 1000
+MAX_MESSAGES_PER_SECOND = 1000
+
+
+class RateLimitFilter(logging.Filter):
+    """Drop records beyond a per-second ceiling."""
+
+    def __init__(self, limit: int = MAX_MESSAGES_PER_SECOND):
+        super().__init__()
+        self.limit = limit
+        self._window = 0
+        self._count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        window = int(record.created)
+        if window != self._window:
+            self._window = window
+            self._count = 0
+        self._count += 1
+        return self._count <= self.limit
+
+
+class TagFormatter(logging.Formatter):
+    """Format as "[tag] message", where tag is the logger name under anthill."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        tag = record.name.partition(".")[2] or record.name
+        text = f"[{tag}] {record.message}"
+        if record.exc_info:
+            text += "\n" + self.formatException(record.exc_info)
+        return text
+
+
+_stream = logging.StreamHandler(sys.stdout)
+_stream.setFormatter(TagFormatter())
+
+_buffer = MemoryHandler(BUFFER_CAPACITY, flushLevel=logging.ERROR, target=_stream)
+_buffer.addFilter(RateLimitFilter())
+
+_root = logging.getLogger("anthill")
+_root.setLevel(logging.INFO)
+_root.addHandler(_buffer)
+_root.propagate = False
+
+
+def get_logger(tag: str) -> logging.Logger:
+    """Logger whose records print as "[tag] message"."""
+    return logging.getLogger(f"anthill.{tag}")
+
+
+def flush_logs():
+    """Write out buffered records."""
+    _buffer.flush()
@@ -1,11 +1,44 @@
 """State management. Load, save, initialize."""
 
+import atexit
 import json
 import time
 from pathlib import Path
 
+# Try orjson, fallback to stdlib json
+USE_ORJSON = True
+try:
+    import orjson
+except ImportError:
+    USE_ORJSON = False
+
 STATE_FILE = Path(__file__).parent.parent / "state" / "game.json"
 
+# Serialized state from the latest deferred save, written by flush_state()
+_pending_save = {"data": None}
+
+
+def dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes. pretty=True indents by two spaces.
+
+    With orjson the output is not byte-identical to the json module's:
+    non-ASCII text is written as raw UTF-8 rather than \\u escapes, floats
+    use the shortest form (1e16, not 1e+16), and NaN/Infinity become null.
+    """
+    if USE_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if pretty else None).encode()
+
+
+def loads(data: bytes | str):
+    """Parse JSON bytes or text."""
+    if USE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def initial_state() -> dict:
     """Fresh game state."""
@@ -44,34 +77,77 @@ def initial_state() -> dict:
 
 
 def load_state() -> dict:
-    """Load state from disk, or initialize if missing."""
+    """Load state from disk, or initialize if missing.
+
+    A deferred save that hasn't been written yet is returned instead, so
+    a load right after a save sees it.
+    """
+    if _pending_save["data"] is not None:
+        return loads(_pending_save["data"])
     if STATE_FILE.exists():
-        with open(STATE_FILE, 'r') as f:
-            return json.load(f)
+        return loads(STATE_FILE.read_bytes())
     return initial_state()
 
 
-def save_state(state: dict):
-    """Persist state to disk with timestamp using atomic write.
+def save_state(state: dict, immediate: bool = False):
+    """Persist state to disk.
+
+    The state is stamped and serialized right away, so later changes to
+    the dict don't leak into the save. By default the write itself waits
+    for flush_state(), which the tick loop calls once per tick; several
+    saves in one tick cost one write and the last one wins. Pass
+    immediate=True to write now, which also drops any deferred save.
+    """
+    state["last_save_timestamp"] = time.time()
+    data = dumps(state, pretty=True)
+
+    if immediate:
+        _pending_save["data"] = None
+        _write_state(data)
+    else:
+        _pending_save["data"] = data
+
+
+def flush_state():
+    """Write out a deferred save, if there is one."""
+    data = _pending_save["data"]
+    _pending_save["data"] = None
+    if data is not None:
+        _write_state(data)
+
+
+atexit.register(flush_state)
+
+
+def _write_state(data: bytes):
+    """Write serialized state to disk using atomic write.
 
     Writes to a temp file first, then renames to avoid corruption
     from concurrent reads or interrupted writes.
     """
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    state["last_save_timestamp"] = time.time()
 
     # Write to temp file first
     temp_file = STATE_FILE.with_suffix('.json.tmp')
-    with open(temp_file, 'w') as f:
-        json.dump(state, f, indent=2)
+    with open(temp_file, 'wb') as f:
+        f.write(data)
         f.flush()  # Ensure data is written to OS buffer
 
     # Atomic rename (on most filesystems)
     temp_file.replace(STATE_FILE)
 
 
+def entity_index(state: dict) -> dict:
+    """Map entity id -> entity for state["entities"].
+
+    Built fresh on each call; a caller doing several lookups should hold
+    on to the result rather than call this per lookup.
+    """
+    return {e["id"]: e for e in state.get("entities", [])}
+
+
 def reset_state():
     """Start over."""
     state = initial_state()
-    save_state(state)
+    save_state(state, immediate=True)
     return state
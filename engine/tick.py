@@ -1,8 +1,8 @@
 """Tick engine. Runs forever. No LLM calls in the hot loop."""
 
 import time
-import json
-from .state import load_state, save_state
+from .log import flush_logs
+from .state import dumps, flush_state, load_state, loads, save_state
 from .bus import bus
 
 # Try Rust core, fallback to Python-only
@@ -95,7 +95,7 @@ def process_offline_progress(state_dict: dict, engine) -> dict:
     # We don't emit events during catch-up to avoid flooding the bus/logs
     # But we do need to update the state
 
-    state_json = json.dumps(state_dict)
+    state_json = dumps(state_dict).decode()
 
     # Process in batches to avoid locking up too long if it's slow (though Rust is fast)
     batch_size = 100
@@ -114,7 +114,7 @@ def process_offline_progress(state_dict: dict, engine) -> dict:
     duration = time.time() - start_time
     print(f"[tick] offline progress complete. Processed {total_processed} ticks in {duration:.3f}s")
 
-    return json.loads(state_json)
+    return loads(state_json)
 
 
 def run():
@@ -130,7 +130,7 @@ def run():
 
     if use_rust:
         try:
-            state_json = json.dumps(state_dict)
+            state_json = dumps(state_dict).decode()
             valid = StateManager.validate(state_json)
             if valid:
                 engine = CoreEngine(int(time.time()))
@@ -144,7 +144,7 @@ def run():
     else:
         print("[tick] Using Python-only mode", flush=True)
 
-    save_state(state_dict)
+    save_state(state_dict, immediate=True)
 
     tick_count = 0
 
@@ -154,9 +154,9 @@ def run():
         # Run tick (Rust or Python)
         try:
             if use_rust and engine:
-                state_json = json.dumps(state_dict) if state_dict else state_json
+                state_json = dumps(state_dict).decode() if state_dict else state_json
                 state_json, events = engine.tick(state_json)
-                state_dict = json.loads(state_json)
+                state_dict = loads(state_json)
             else:
                 # Python-only mode
                 if state_dict is None:
@@ -175,13 +175,17 @@ def run():
         # Always keep state_dict updated and emit tick for plugins
         state_dict["last_save_timestamp"] = time.time()
 
+        # Emit tick event for plugins. They mutate state_dict in place,
+        # so the save below picks up everything they did this tick.
+        bus.emit("tick", state_dict)
+
         # Save every 50 ticks
         if tick_count % 50 == 0:
-            save_state(state_dict)
-
-        # Emit tick event for plugins
-        bus.emit("tick", state_dict)
+            save_state(state_dict, immediate=True)
 
+        # Write any save a plugin deferred during this tick
+        flush_state()
+        flush_logs()
         tick_count += 1
 
         # Sleep to maintain 1 tick/second
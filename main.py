@@ -16,7 +16,7 @@ def main():
     # Initialize state if needed
     if not STATE_FILE.exists():
         print("[main] initializing fresh state")
-        save_state(initial_state())
+        save_state(initial_state(), immediate=True)
 
     # Load plugins
     print("[main] loading plugins")
@@ -0,0 +1,40 @@
+"""Buffered random numbers for plugin rolls.
+
+next_rand() hands out floats in [0, 1) from a block drawn 1024 at a time,
+with numpy's generator when numpy is installed and the random module
+otherwise.
+"""
+
+import random
+
+# Try numpy, fallback to the random module
+USE_NUMPY = True
+try:
+    import numpy
+except ImportError:
+    USE_NUMPY = False
+
+BUFFER_SIZE = 1024
+
+_rng = numpy.random.default_rng() if USE_NUMPY else None
+_buf = []
+_idx = BUFFER_SIZE
+
+
+def _refill():
+    global _buf, _idx
+    if USE_NUMPY:
+        _buf = _rng.random(BUFFER_SIZE).tolist()
+    else:
+        _buf = [random.random() for _ in range(BUFFER_SIZE)]
+    _idx = 0
+
+
+def next_rand() -> float:
+    """Next float in [0, 1)."""
+    global _idx
+    if _idx >= BUFFER_SIZE:
+        _refill()
+    value = _buf[_idx]
+    _idx += 1
+    return value
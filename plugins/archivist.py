@@ -12,6 +12,8 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from plugins.event_logger import iso_timestamp, read_event_log
+
 PLUGIN_ID = "archivist"
 
 # Archivist schedule
@@ -45,7 +47,9 @@ def gather_observations(state: dict) -> dict:
     resources = state.get("resources", {})
 
     # Recent events from event log
-    event_log = state.get("meta", {}).get("event_log", [])[-10:]
+    event_log = [
+        dict(event, timestamp=iso_timestamp(event)) for event in read_event_log(10)
+    ]
 
     # Systems
     systems = state.get("systems", {})
@@ -189,7 +193,7 @@ def should_archive(state: dict) -> bool:
         return True
 
     # Wake if a visitor just arrived (check event log)
-    event_log = meta.get("event_log", [])
+    event_log = read_event_log(1)
     if event_log:
         last_event = event_log[-1]
         if last_event.get("type") == "visitor_arrival":
@@ -230,9 +234,8 @@ def spawn_archivist_agent(observations: dict) -> None:
 def on_tick(payload: dict):
     """Check if Archivist should wake and archive."""
     global _last_archive_tick
-    from engine.state import load_state
 
-    state = load_state()
+    state = payload
 
     if not should_archive(state):
         return
@@ -6,6 +6,7 @@ this plugin automatically crafts jewelry and adorns an ant.
 This creates natural cycles: adornment → influence → visitors → death → restart.
 """
 
+from engine.state import entity_index
 
 PLUGIN_ID = "auto_ornamental"
 
@@ -73,12 +74,7 @@ def adorn_ant(state: dict, ant_id: str, jewelry_index: int) -> dict:
         return state
 
     # Find the ant
-    ant = None
-    for e in state["entities"]:
-        if e["id"] == ant_id:
-            ant = e
-            break
-
+    ant = entity_index(state).get(ant_id)
     if ant is None:
         return state
 
@@ -115,7 +111,7 @@ def adorn_ant(state: dict, ant_id: str, jewelry_index: int) -> dict:
 def cleanup_orphaned_jewelry(state: dict) -> dict:
     """Remove jewelry worn by dead entities, making it available for re-crafting."""
     jewelry_list = state.get("meta", {}).get("jewelry", [])
-    living_ids = {e["id"] for e in state.get("entities", [])}
+    living_ids = entity_index(state)
 
     orphaned_count = 0
     for jewelry in jewelry_list:
@@ -209,10 +205,8 @@ def check_auto_craft(state: dict) -> dict:
 
 
 def on_tick(payload: dict):
-    """Main tick handler."""
-    from engine.state import load_state, save_state
-
-    state = load_state()
+    """Main tick handler. Mutates the live tick state."""
+    state = payload
 
     # Only operate if crafting hollow exists
     if "crafting_hollow" not in state.get("systems", {}):
@@ -224,8 +218,6 @@ def on_tick(payload: dict):
     # Check if we should auto-craft (will also re-adorn recovered jewelry)
     state = check_auto_craft(state)
 
-    save_state(state)
-
 
 def register(bus, state):
     """Register handlers."""
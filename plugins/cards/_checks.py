@@ -0,0 +1,40 @@
+"""Shared condition checks for the card waves.
+
+A wave's cards are fixed once CARDS is defined, so the (id, fired bit,
+condition) triples are worked out once per wave at import instead of
+walking the dict and looking up bits every tick.
+"""
+
+from engine.log import get_logger
+from plugins.cards._fired import card_bit
+
+_log = get_logger("cards")
+
+
+def compile_conditions(cards: dict):
+    """Build check(state, fired) -> ids of unfired cards whose condition holds.
+
+    `fired` is the bitset from fired_bits(). A condition that raises is
+    treated as not met; the first failure of each card is logged.
+    """
+    checks = tuple(
+        (card_id, card_bit(card_id) if card.get("fires_once") else 0, card["condition"])
+        for card_id, card in cards.items()
+    )
+    failing = set()
+
+    def check(state, fired):
+        drawn = []
+        for card_id, bit, condition in checks:
+            if fired & bit:
+                continue
+            try:
+                if condition(state):
+                    drawn.append(card_id)
+            except Exception:
+                if card_id not in failing:
+                    failing.add(card_id)
+                    _log.exception("condition for %s raised; treating it as not met", card_id)
+        return drawn
+
+    return check
@@ -0,0 +1,47 @@
+"""Fired-card bookkeeping shared by the card waves.
+
+meta.fired_cards stays the persisted record (the Rust core and the docs
+both expect a list of ids). Membership checks go through an int bitset
+built from it, one bit per card id, so each wave tests a bit instead of
+hashing strings into a set.
+"""
+
+from engine.state import save_state
+
+_card_bits = {}
+
+
+def card_bit(card_id: str) -> int:
+    """Get the bit for a card id, assigning the next free one if unseen."""
+    bit = _card_bits.get(card_id)
+    if bit is None:
+        bit = _card_bits[card_id] = 1 << len(_card_bits)
+    return bit
+
+
+def fired_bits(state: dict) -> int:
+    """Get the fired-card bitset for meta.fired_cards."""
+    bits = 0
+    for card_id in state.get("meta", {}).get("fired_cards", []):
+        bits |= card_bit(card_id)
+    return bits
+
+
+def mark_card_fired(state: dict, card_id: str) -> bool:
+    """Mark a card as fired in game state. Returns True if it wasn't already."""
+    fired = state.setdefault("meta", {}).setdefault("fired_cards", [])
+    bit = card_bit(card_id)
+    bits = fired_bits(state)
+    if bits & bit:
+        return False
+    fired.append(card_id)
+    return True
+
+
+def persist_fired(state: dict):
+    """Save state after cards were marked fired.
+
+    The tick payload is the live state, so it is saved as-is without
+    re-reading the file first. The save is deferred to the end of the tick.
+    """
+    save_state(state)
@@ -1,9 +1,11 @@
 """Starter cards. Bootstrap the game."""
 
-import json
 from pathlib import Path
 from datetime import datetime
 
+from engine.state import dumps
+from plugins.cards._fired import card_bit, fired_bits, mark_card_fired
+
 PLUGIN_ID = "starter_cards"
 
 DECISIONS_LOG = Path(__file__).parent.parent.parent / "logs" / "decisions.jsonl"
@@ -20,8 +22,8 @@ def log_decision(tick: int, decision_type: str, choice: str, why: str, alternati
         "why": why,
         "alternatives_considered": alternatives or []
     }
-    with open(DECISIONS_LOG, 'a') as f:
-        f.write(json.dumps(entry) + '\n')
+    with open(DECISIONS_LOG, 'ab') as f:
+        f.write(dumps(entry) + b'\n')
 
 
 def emit_card(bus, card: dict):
@@ -39,6 +41,7 @@ CARDS = {
             "completion": {"resource": "dirt", "amount": 10}
         },
         "fires_once": True,
+        "gate": {"max_tick": 1},
         "condition": lambda state: state["tick"] == 1
     },
     "first_system": {
@@ -50,6 +53,7 @@ CARDS = {
             "completion": {"systems_count": 1}
         },
         "fires_once": True,
+        "gate": {"max_systems": 0},
         "condition": lambda state: state["resources"].get("dirt", 0) >= 10 and len(state["systems"]) == 0
     },
     "the_grind_begins": {
@@ -62,6 +66,7 @@ CARDS = {
         "side_task": "Notice what you're thinking while waiting.",
         "duration_estimate_ticks": 600,
         "fires_once": True,
+        "gate": {"min_systems": 1},
         "condition": lambda state: len(state["systems"]) >= 1 and max(state["resources"].values(), default=0) < 100
     },
     "boredom_acknowledged": {
@@ -84,28 +89,88 @@ CARDS = {
             "completion": {"tiles_count": 3}
         },
         "fires_once": True,
+        "gate": {"min_systems": 1},
+        "memo_key": lambda state: (len(state["systems"]), len(state["map"]["tiles"])),
         "condition": lambda state: len(state["systems"]) >= 1 and len(state["map"]["tiles"]) < 3
     }
 }
 
-# Track which cards have fired
+
+def _compile_gate(card: dict) -> tuple:
+    """Card gate as (min_tick, max_tick, min_systems, max_systems)."""
+    gate = card["gate"]
+    return (
+        gate.get("min_tick", 0),
+        gate.get("max_tick", float("inf")),
+        gate.get("min_systems", 0),
+        gate.get("max_systems", float("inf")),
+    )
+
+
+# Cards checked on tick, with their gates. A gate is a cheap necessary
+# condition: when it fails, the card's condition isn't called. Cards
+# without a gate (boredom_acknowledged) are drawn by events instead.
+TICK_CARDS = tuple(
+    (card_id, card, _compile_gate(card))
+    for card_id, card in CARDS.items()
+    if "gate" in card
+)
+
+# The tick handler is registered under its own id so it can be dropped
+# once every tick card has fired, leaving the boredom handler in place
+TICK_HANDLER_ID = f"{PLUGIN_ID}.tick"
+
+# Track which cards have fired. Fires are also recorded in meta.fired_cards,
+# the same persisted list the card waves use, so they survive a restart.
 fired_cards = set()
 
+# TICK_CARDS entries still able to fire. Fires-once cards leave when drawn,
+# and any card leaves once the tick passes its max_tick.
+_remaining_cards = []
+
+# Card id -> memo_key value the last time its condition came out False.
+# A card with a "memo_key" (a cheap fingerprint of everything its condition
+# reads) isn't re-checked until that fingerprint changes.
+_false_keys = {}
+
 
 def on_tick(payload: dict):
     """Check card conditions on each tick."""
     state = payload
     bus = _bus  # Captured during register
-
-    for card_id, card in CARDS.items():
-        if card.get("fires_once") and card_id in fired_cards:
+    tick = state["tick"]
+    systems_count = len(state["systems"])
+
+    retired = []
+    for entry in _remaining_cards:
+        card_id, card, (min_tick, max_tick, min_systems, max_systems) = entry
+        if tick > max_tick:
+            retired.append(entry)  # Its window has passed for good
+            continue
+        if not (min_tick <= tick and min_systems <= systems_count <= max_systems):
             continue
 
+        memo_key = card.get("memo_key")
+        if memo_key is not None:
+            key = memo_key(state)
+            if _false_keys.get(card_id) == key:
+                continue
+
         if card["condition"](state):
             emit_card(bus, card)
             if card.get("fires_once"):
                 fired_cards.add(card_id)
+                mark_card_fired(state, card_id)
+                retired.append(entry)
             print(f"[cards] drew: {card_id}")
+        elif memo_key is not None:
+            _false_keys[card_id] = key
+
+    if retired:
+        for entry in retired:
+            _remaining_cards.remove(entry)
+        if not _remaining_cards:
+            bus.unregister(TICK_HANDLER_ID)
 
 
 def on_boredom(payload: dict):
@@ -123,10 +188,15 @@ def register(bus, state):
     """Register card handlers."""
     global _bus
     _bus = bus
-    bus.register("tick", on_tick, PLUGIN_ID)
+    bits = fired_bits(state)
+    fired_cards.update(card_id for card_id in CARDS if bits & card_bit(card_id))
+    _remaining_cards[:] = [entry for entry in TICK_CARDS if entry[0] not in fired_cards]
+    if _remaining_cards:
+        bus.register("tick", on_tick, TICK_HANDLER_ID)
     bus.register("boredom", on_boredom, PLUGIN_ID)
 
 
 def unregister(bus):
     """Unregister handlers."""
+    bus.unregister(TICK_HANDLER_ID)
     bus.unregister(PLUGIN_ID)
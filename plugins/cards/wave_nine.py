@@ -3,6 +3,9 @@
 Ghost jewelry. The dead wearing copper. What do you do with artifacts of vanished ants?
 """
 
+from plugins.cards._checks import compile_conditions
+from plugins.cards._fired import fired_bits, mark_card_fired
+
 PLUGIN_ID = "wave_nine"
 
 CARDS = {
@@ -46,6 +49,8 @@ CARDS = {
     }
 }
 
+_check_cards = compile_conditions(CARDS)
+
 _bus = None
 
 
@@ -54,24 +59,12 @@ def on_tick(payload: dict):
     state = payload
     bus = _bus
 
-    fired_cards = state.get("meta", {}).get("fired_cards", [])
-
-    for card_id, card in CARDS.items():
-        if card_id in fired_cards:
-            continue
-
-        try:
-            if card["condition"](state):
-                bus.emit("card_drawn", card)
-                if card.get("fires_once", True):
-                    if "meta" not in state:
-                        state["meta"] = {}
-                    if "fired_cards" not in state["meta"]:
-                        state["meta"]["fired_cards"] = []
-                    state["meta"]["fired_cards"].append(card_id)
-                print(f"[wave_nine] card fired: {card_id}")
-        except Exception as e:
-            print(f"[wave_nine] error checking {card_id}: {e}")
+    for card_id in _check_cards(state, fired_bits(state)):
+        card = CARDS[card_id]
+        bus.emit("card_drawn", card)
+        if card.get("fires_once", True):
+            mark_card_fired(state, card_id)
+        print(f"[wave_nine] card fired: {card_id}")
 
 
 def register(bus, state):
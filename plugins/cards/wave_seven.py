@@ -6,6 +6,9 @@ The colony wants a home. Decorations from visitors.
 
 import random
 
+from plugins.cards._checks import compile_conditions
+from plugins.cards._fired import fired_bits, mark_card_fired, persist_fired
+
 PLUGIN_ID = "wave_seven"
 
 # The Wiki Whisperer can fire repeatedly with cooldown
@@ -66,71 +69,41 @@ CARDS = {
     }
 }
 
-_bus = None
-
-
-def get_fired_cards(state):
-    """Get set of fired card IDs from game state."""
-    return set(state.get("meta", {}).get("fired_cards", []))
+# The wiki card rolls separately in on_tick; the rest share one fused check
+_check_cards = compile_conditions(
+    {card_id: card for card_id, card in CARDS.items() if not card.get("is_wiki_card")}
+)
 
-
-def mark_card_fired(state, card_id):
-    """Mark a card as fired in game state."""
-    if "meta" not in state:
-        state["meta"] = {}
-    if "fired_cards" not in state["meta"]:
-        state["meta"]["fired_cards"] = []
-    if card_id not in state["meta"]["fired_cards"]:
-        state["meta"]["fired_cards"].append(card_id)
+_bus = None
 
 
 def on_tick(payload: dict):
     """Check card conditions on each tick."""
     global _last_wiki_tick
-    from engine.state import load_state, save_state
-
     state = payload
     bus = _bus
-    fired_cards = get_fired_cards(state)
     any_fired = False
     tick = state.get("tick", 0)
 
-    for card_id, card in CARDS.items():
-        if card.get("fires_once") and card_id in fired_cards:
-            continue
-
-        # Special handling for wiki whisperer card
-        if card.get("is_wiki_card"):
-            # Check cooldown
-            if tick - _last_wiki_tick < WIKI_COOLDOWN:
-                continue
-            # Roll for rare event
-            if random.random() > WIKI_CHANCE:
-                continue
-            # Passed all checks - fire the wiki card with random prompt
-            _last_wiki_tick = tick
-            wiki_prompt = random.choice(WIKI_PROMPTS)
-            card_copy = card.copy()
-            card_copy["prompt"] = f"The Wiki Whisperer speaks: \"{wiki_prompt}\"\n\nThe wiki demands attention. Interpret this prompt as you will. Add content. Improve structure. Polish prose. Or simply ponder what documentation means for a game that plays itself."
-            bus.emit("card_drawn", card_copy)
-            print(f"[wave_seven] wiki whispers: {wiki_prompt}")
-            continue
-
-        try:
-            if card["condition"](state):
-                bus.emit("card_drawn", card)
-                if card.get("fires_once"):
-                    mark_card_fired(state, card_id)
-                    any_fired = True
-                print(f"[wave_seven] drew: {card_id}")
-        except Exception:
-            pass  # Condition failed, skip
-
-    # Persist fired cards to disk
+    # Special handling for wiki whisperer card: cooldown, then a roll
+    if tick - _last_wiki_tick >= WIKI_COOLDOWN and random.random() <= WIKI_CHANCE:
+        # Passed all checks - fire the wiki card with random prompt
+        _last_wiki_tick = tick
+        wiki_prompt = random.choice(WIKI_PROMPTS)
+        card_copy = CARDS["wiki_whisperer"].copy()
+        card_copy["prompt"] = f"The Wiki Whisperer speaks: \"{wiki_prompt}\"\n\nThe wiki demands attention. Interpret this prompt as you will. Add content. Improve structure. Polish prose. Or simply ponder what documentation means for a game that plays itself."
+        bus.emit("card_drawn", card_copy)
+        print(f"[wave_seven] wiki whispers: {wiki_prompt}")
+
+    for card_id in _check_cards(state, fired_bits(state)):
+        card = CARDS[card_id]
+        bus.emit("card_drawn", card)
+        if card.get("fires_once"):
+            any_fired |= mark_card_fired(state, card_id)
+        print(f"[wave_seven] drew: {card_id}")
+
     if any_fired:
-        disk_state = load_state()
-        disk_state["meta"]["fired_cards"] = state["meta"].get("fired_cards", [])
-        save_state(disk_state)
+        persist_fired(state)
 
 
 def register(bus, state):
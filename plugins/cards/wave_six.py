@@ -7,10 +7,12 @@ The walls of reality are breached.
 
 import random
 
+from plugins.cards._checks import compile_conditions
+from plugins.cards._fired import fired_bits, mark_card_fired, persist_fired
+
 PLUGIN_ID = "wave_six"
 
 # WWCD cooldown tracking
-_last_wwcd_tick = 0
 WWCD_COOLDOWN = 3600  # 1 hour between possible fires
 WWCD_CHANCE = 0.001  # 0.1% per tick when off cooldown (~once per 1000 ticks when eligible)
 
@@ -129,88 +131,56 @@ CARDS = {
     }
 }
 
-_bus = None
-_failed_summons = 0
-
-
-def get_fired_cards(state):
-    """Get set of fired card IDs from game state."""
-    return set(state.get("meta", {}).get("fired_cards", []))
-
-
-def mark_card_fired(state, card_id):
-    """Mark a card as fired in game state."""
-    if "meta" not in state:
-        state["meta"] = {}
-    if "fired_cards" not in state["meta"]:
-        state["meta"]["fired_cards"] = []
-    if card_id not in state["meta"]["fired_cards"]:
-        state["meta"]["fired_cards"].append(card_id)
-
-
-def on_summoning_failed(payload: dict):
-    """Track failed summoning attempts."""
-    global _failed_summons
-    _failed_summons += 1
-
-    from engine.state import load_state, save_state
-    state = load_state()
-    if "meta" not in state:
-        state["meta"] = {}
-    state["meta"]["failed_summons"] = _failed_summons
-    save_state(state)
-
-
-def on_tick(payload: dict):
-    """Check card conditions on each tick."""
-    global _last_wwcd_tick
-    from engine.state import load_state, save_state
-
-    state = payload
-    bus = _bus
-    fired_cards = get_fired_cards(state)
-    any_fired = False
-    tick = state.get("tick", 0)
-
-    for card_id, card in CARDS.items():
-        if card.get("fires_once") and card_id in fired_cards:
-            continue
-
-        # Special handling for rare cards (like WWCD)
-        if card.get("is_rare"):
-            # Check cooldown
-            if tick - _last_wwcd_tick < WWCD_COOLDOWN:
-                continue
-            # Roll for rare event
-            if random.random() > WWCD_CHANCE:
-                continue
-            # Passed all checks - fire the rare card
-            _last_wwcd_tick = tick
-            bus.emit("card_drawn", card)
-            print(f"[wave_six] RARE EVENT: {card_id}")
-            continue
-
-        try:
-            if card["condition"](state):
-                bus.emit("card_drawn", card)
-                if card.get("fires_once"):
-                    mark_card_fired(state, card_id)
-                    any_fired = True
-                print(f"[wave_six] drew: {card_id}")
-        except Exception:
-            pass  # Condition failed, skip
-
-    # Persist fired cards to disk
-    if any_fired:
-        disk_state = load_state()
-        disk_state["meta"]["fired_cards"] = state["meta"].get("fired_cards", [])
-        save_state(disk_state)
+# Rare cards roll separately in on_tick; the rest share one fused check
+_check_cards = compile_conditions(
+    {card_id: card for card_id, card in CARDS.items() if not card.get("is_rare")}
+)
 
 
 def register(bus, state):
-    """Register card handlers."""
-    global _bus
-    _bus = bus
+    """Register card handlers.
+
+    Handler state (the bus, the failed summon count, the WWCD cooldown)
+    lives in this closure rather than in module globals.
+    """
+    failed_summons = state.get("meta", {}).get("failed_summons", 0)
+    failed_summons_dirty = False
+    last_wwcd_tick = 0
+
+    def on_summoning_failed(payload: dict):
+        """Track failed summoning attempts. Written to state on the next tick."""
+        nonlocal failed_summons, failed_summons_dirty
+        failed_summons += 1
+        failed_summons_dirty = True
+
+    def on_tick(payload: dict):
+        """Check card conditions on each tick."""
+        nonlocal last_wwcd_tick, failed_summons_dirty
+
+        state = payload
+        any_fired = False
+        tick = state.get("tick", 0)
+
+        if failed_summons_dirty:
+            state.setdefault("meta", {})["failed_summons"] = failed_summons
+            failed_summons_dirty = False
+
+        for card_id in _check_cards(state, fired_bits(state)):
+            card = CARDS[card_id]
+            bus.emit("card_drawn", card)
+            if card.get("fires_once"):
+                any_fired |= mark_card_fired(state, card_id)
+            print(f"[wave_six] drew: {card_id}")
+
+        # Special handling for the rare WWCD card: cooldown, then a roll
+        if tick - last_wwcd_tick >= WWCD_COOLDOWN and random.random() <= WWCD_CHANCE:
+            last_wwcd_tick = tick
+            bus.emit("card_drawn", CARDS["wwcd"])
+            print("[wave_six] RARE EVENT: wwcd")
+
+        if any_fired:
+            persist_fired(state)
+
     bus.register("tick", on_tick, PLUGIN_ID)
     bus.register("summoning_failed", on_summoning_failed, PLUGIN_ID)
     print("[wave_six] The Outside awaits")
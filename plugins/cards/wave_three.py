@@ -1,5 +1,8 @@
 """Wave three cards. Emerge from mature colony dynamics."""
 
+from plugins.cards._checks import compile_conditions
+from plugins.cards._fired import fired_bits, mark_card_fired, persist_fired
+
 PLUGIN_ID = "wave_three"
 
 CARDS = {
@@ -144,52 +147,26 @@ CARDS = {
     }
 }
 
-_bus = None
-
-
-def get_fired_cards(state):
-    """Get set of fired card IDs from game state."""
-    return set(state.get("meta", {}).get("fired_cards", []))
+_check_cards = compile_conditions(CARDS)
 
-
-def mark_card_fired(state, card_id):
-    """Mark a card as fired in game state."""
-    if "meta" not in state:
-        state["meta"] = {}
-    if "fired_cards" not in state["meta"]:
-        state["meta"]["fired_cards"] = []
-    if card_id not in state["meta"]["fired_cards"]:
-        state["meta"]["fired_cards"].append(card_id)
+_bus = None
 
 
 def on_tick(payload: dict):
     """Check card conditions on each tick."""
-    from engine.state import load_state, save_state
-
     state = payload
     bus = _bus
-    fired_cards = get_fired_cards(state)
     any_fired = False
 
-    for card_id, card in CARDS.items():
-        if card.get("fires_once") and card_id in fired_cards:
-            continue
-
-        try:
-            if card["condition"](state):
-                bus.emit("card_drawn", card)
-                if card.get("fires_once"):
-                    mark_card_fired(state, card_id)
-                    any_fired = True
-                print(f"[wave_three] drew: {card_id}")
-        except Exception:
-            pass  # Condition failed, skip
+    for card_id in _check_cards(state, fired_bits(state)):
+        card = CARDS[card_id]
+        bus.emit("card_drawn", card)
+        if card.get("fires_once"):
+            any_fired |= mark_card_fired(state, card_id)
+        print(f"[wave_three] drew: {card_id}")
 
-    # Persist fired cards to disk
     if any_fired:
-        disk_state = load_state()
-        disk_state["meta"]["fired_cards"] = state["meta"].get("fired_cards", [])
-        save_state(disk_state)
+        persist_fired(state)
 
 
 def register(bus, state):
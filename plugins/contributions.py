@@ -2,16 +2,28 @@
 
 Observers use the /contribute endpoint to queue resource contributions to goals.
 This plugin processes those contributions safely within the tick loop.
+
+The viewer runs in its own process and appends to contributions.json. The
+file is only read back when its modification time changes, and whatever it
+holds is moved onto an in-memory queue that the same tick works through.
 """
 
 import json
+import os
+from collections import deque
 from pathlib import Path
 
+from engine.log import get_logger
+from engine.state import dumps, loads
+
 PLUGIN_ID = "contributions"
 
 CONTRIBUTIONS_FILE = Path(__file__).parent.parent / "state" / "contributions.json"
 
 _bus = None
+_log = get_logger(PLUGIN_ID)
+_pending = deque()
+_file_mtime = None  # st_mtime_ns of CONTRIBUTIONS_FILE when last drained
 
 
 def load_contributions() -> list:
@@ -19,33 +31,60 @@ def load_contributions() -> list:
     if not CONTRIBUTIONS_FILE.exists():
         return []
     try:
-        with open(CONTRIBUTIONS_FILE, 'r') as f:
-            data = json.load(f)
-            return data.get("contributions", [])
+        data = loads(CONTRIBUTIONS_FILE.read_bytes())
+        return data.get("contributions", [])
     except (json.JSONDecodeError, IOError):
         return []
 
 
+def _write_contributions(contributions: list):
+    """Replace the file in one step so the viewer never reads a partial write."""
+    temp_file = CONTRIBUTIONS_FILE.with_suffix('.json.tmp')
+    temp_file.write_bytes(dumps({"contributions": contributions}))
+    os.replace(temp_file, CONTRIBUTIONS_FILE)
+
+
 def clear_contributions():
     """Clear processed contributions."""
-    with open(CONTRIBUTIONS_FILE, 'w') as f:
-        json.dump({"contributions": []}, f)
+    _write_contributions([])
 
 
-def on_tick(payload: dict):
-    """Process queued contributions."""
-    from engine.state import load_state, save_state
+def _drain_file():
+    """Move contributions written by the viewer onto the queue."""
+    global _file_mtime
 
-    contributions = load_contributions()
-    if not contributions:
+    try:
+        mtime = CONTRIBUTIONS_FILE.stat().st_mtime_ns
+    except OSError:
+        return
+    if mtime == _file_mtime:
         return
 
-    state = load_state()
+    try:
+        contributions = loads(CONTRIBUTIONS_FILE.read_bytes()).get("contributions", [])
+    except (json.JSONDecodeError, IOError):
+        return  # Caught mid-write; try again next tick
+
+    if contributions:
+        _pending.extend(contributions)
+        clear_contributions()
+        mtime = CONTRIBUTIONS_FILE.stat().st_mtime_ns
+    _file_mtime = mtime
+
+
+def on_tick(payload: dict):
+    """Process queued contributions against the live tick state."""
+    _drain_file()
+    if not _pending:
+        return
+
+    state = payload
     goals = state.get("meta", {}).get("goals", {})
     resources = state.get("resources", {})
 
     processed = 0
-    for contrib in contributions:
+    while _pending:
+        contrib = _pending.popleft()
         goal_id = contrib.get("goal_id")
         resource = contrib.get("resource")
         amount = contrib.get("amount", 1)
@@ -77,18 +116,14 @@ def on_tick(payload: dict):
         goal["progress"][resource] = current_progress + actual_amount
         processed += 1
 
-        print(f"[contributions] {actual_amount:.1f} {resource} -> {goal.get('name', goal_id)}")
+        _log.info("%.1f %s -> %s", actual_amount, resource, goal.get('name', goal_id))
 
-        # Check if goal is now complete
-        all_complete = True
-        for res, req in cost.items():
-            if goal["progress"].get(res, 0) < req:
-                all_complete = False
-                break
-
-        if all_complete:
+        # Check if goal is now complete. Compared per resource against the
+        # clamped progress, so fractional amounts can't leave float dust.
+        progress = goal["progress"]
+        if all(progress.get(res, 0) >= req for res, req in cost.items()):
             goal["built"] = True
-            print(f"[contributions] GOAL COMPLETE: {goal.get('name', goal_id)}!")
+            _log.info("GOAL COMPLETE: %s!", goal.get('name', goal_id))
             _bus.emit("goal_complete", {
                 "tick": state["tick"],
                 "goal_id": goal_id,
@@ -97,10 +132,6 @@ def on_tick(payload: dict):
 
     if processed > 0:
         state["resources"] = resources
-        save_state(state)
-
-    # Clear processed contributions
-    clear_contributions()
 
 
 def register(bus, state):
@@ -108,7 +139,7 @@ def register(bus, state):
     global _bus
     _bus = bus
     bus.register("tick", on_tick, PLUGIN_ID)
-    print("[contributions] Ready to process goal contributions")
+    _log.info("Ready to process goal contributions")
 
 
 def unregister(bus):
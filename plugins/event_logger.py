@@ -2,18 +2,122 @@
 
 Solves mysteries like "where did that influence come from?" by maintaining
 a visible history of what happened.
+
+The buffer lives on disk in state/event_log.ring: a 16-byte header holding
+the (head, tail) event counters, then MAX_EVENTS fixed-size slots of
+space-padded JSON. Logging an event overwrites one slot and the header, so
+the cost doesn't grow with the buffer. Use read_event_log() to get the
+events back, oldest first.
 """
 
-from collections import deque
+import struct
+import time
 from datetime import datetime
+from pathlib import Path
+
+from engine.log import get_logger
+from engine.state import dumps, loads, save_state
 
 PLUGIN_ID = "event_logger"
 
 # Maximum events to keep
 MAX_EVENTS = 50
 
+RING_FILE = Path(__file__).parent.parent / "state" / "event_log.ring"
+SLOT_SIZE = 512
+HEADER = struct.Struct("<QQ")  # head, tail: counts of events ever logged
+
 _bus = None
-_event_buffer = deque(maxlen=MAX_EVENTS)
+_log = get_logger(PLUGIN_ID)
+_event_log = get_logger("event_log")
+_ring = None  # Open handle on RING_FILE
+_head = 0
+_tail = 0
+
+
+def _slot_offset(n: int) -> int:
+    return HEADER.size + (n % MAX_EVENTS) * SLOT_SIZE
+
+
+def _encode_slot(event: dict) -> bytes | None:
+    """Encode an event as one newline-terminated, space-padded slot.
+
+    Oversized events lose their details, then the end of their message.
+    Returns None if the event still doesn't fit.
+    """
+    data = dumps(event)
+    if len(data) >= SLOT_SIZE and "details" in event:
+        event = {k: v for k, v in event.items() if k != "details"}
+        data = dumps(event)
+    if len(data) >= SLOT_SIZE and isinstance(event.get("message"), str):
+        # Each character dropped saves at least one byte
+        overflow = len(data) - SLOT_SIZE + 4
+        event = dict(event, message=event["message"][:-overflow] + "...")
+        data = dumps(event)
+    if len(data) >= SLOT_SIZE:
+        return None
+    return data.ljust(SLOT_SIZE - 1) + b"\n"
+
+
+def _open_ring():
+    """Open the ring file, creating and pre-allocating it if needed."""
+    global _ring, _head, _tail
+
+    if _ring is not None:
+        _ring.close()
+
+    size = HEADER.size + MAX_EVENTS * SLOT_SIZE
+    if not RING_FILE.exists() or RING_FILE.stat().st_size != size:
+        RING_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(RING_FILE, "wb") as f:
+            f.write(HEADER.pack(0, 0))
+            f.truncate(size)
+
+    _ring = open(RING_FILE, "r+b")
+    _head, _tail = HEADER.unpack(_ring.read(HEADER.size))
+
+
+def _append(event: dict):
+    global _head, _tail
+
+    if _ring is None:
+        return  # Not registered; log_event still writes to the logger
+    slot = _encode_slot(event)
+    if slot is None:
+        _log.warning("Event too large for the ring, skipped: %s", event.get("type"))
+        return
+
+    _ring.seek(_slot_offset(_tail))
+    _ring.write(slot)
+    _tail += 1
+    _head = max(_head, _tail - MAX_EVENTS)
+    _ring.seek(0)
+    _ring.write(HEADER.pack(_head, _tail))
+    _ring.flush()
+
+
+def iso_timestamp(event: dict) -> str:
+    """Format an event's timestamp (stored as epoch seconds) as ISO 8601."""
+    timestamp = event.get("timestamp")
+    if isinstance(timestamp, (int, float)):
+        return datetime.fromtimestamp(timestamp).isoformat()
+    return timestamp  # Already a string in logs from older versions
+
+
+def read_event_log(limit: int = None) -> list:
+    """Return the logged events, oldest first (only the last `limit` if given)."""
+    if not RING_FILE.exists():
+        return []
+
+    with open(RING_FILE, "rb") as f:
+        head, tail = HEADER.unpack(f.read(HEADER.size))
+        if limit is not None:
+            head = max(head, tail - limit)
+        events = []
+        for n in range(head, tail):
+            f.seek(_slot_offset(n))
+            events.append(loads(f.read(SLOT_SIZE)))
+    return events
 
 
 def log_event(event_type: str, tick: int, message: str, details: dict = None):
@@ -21,32 +125,14 @@ def log_event(event_type: str, tick: int, message: str, details: dict = None):
     event = {
         "type": event_type,
         "tick": tick,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": time.time(),
         "message": message
     }
     if details:
         event["details"] = details
 
-    _event_buffer.append(event)
-    print(f"[event_log] {message}")
-
-
-def on_tick(payload: dict):
-    """Persist event log to state every 50 ticks."""
-    from engine.state import load_state, save_state
-
-    state = payload
-    tick = state.get("tick", 0)
-
-    # Only update state periodically to reduce I/O
-    if tick % 50 == 0:
-        state = load_state()
-        if "event_log" not in state.get("meta", {}):
-            state["meta"]["event_log"] = []
-
-        # Store the buffer as a list
-        state["meta"]["event_log"] = list(_event_buffer)
-        save_state(state)
+    _append(event)
+    _event_log.info("%s", message)
 
 
 def on_ants_spawned(payload: dict):
@@ -142,16 +228,21 @@ def on_card_drawn(payload: dict):
 
 def register(bus, state):
     """Register event handlers."""
-    global _bus, _event_buffer
+    global _bus
     _bus = bus
 
-    # Initialize from state if it exists
-    existing_log = state.get("meta", {}).get("event_log", [])
-    if existing_log:
-        _event_buffer = deque(existing_log, maxlen=MAX_EVENTS)
+    _open_ring()
+
+    # Carry over a log saved in state by older versions, then drop it
+    meta = state.get("meta", {})
+    if "event_log" in meta:
+        existing_log = meta.pop("event_log")
+        if existing_log and _tail == 0:
+            for event in existing_log[-MAX_EVENTS:]:
+                _append(event)
+        save_state(state)
 
     # Register handlers for all interesting events
-    bus.register("tick", on_tick, PLUGIN_ID)
     bus.register("ants_spawned", on_ants_spawned, PLUGIN_ID)
     bus.register("entity_death", on_entity_death, PLUGIN_ID)
     bus.register("visitor_arrived", on_visitor_arrived, PLUGIN_ID)
@@ -160,9 +251,13 @@ def register(bus, state):
     bus.register("summoning_failed", on_summoning_failed, PLUGIN_ID)
     bus.register("card_drawn", on_card_drawn, PLUGIN_ID)
 
-    print("[event_logger] Now watching. All significant events will be recorded.")
+    _log.info("Now watching. All significant events will be recorded.")
 
 
 def unregister(bus):
     """Unregister handlers."""
+    global _ring
     bus.unregister(PLUGIN_ID)
+    if _ring is not None:
+        _ring.close()
+        _ring = None
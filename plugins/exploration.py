@@ -1,59 +1,79 @@
 """Exploration plugin. Discover new tiles when resources allow."""
 
 import random
+from dataclasses import asdict, dataclass
+
+from engine.log import get_logger
 
 PLUGIN_ID = "exploration"
 
+
+@dataclass(frozen=True, slots=True)
+class Discovery:
+    id: str
+    name: str
+    type: str
+    x: int
+    y: int
+    resource: str
+    description: str
+
+
 # Possible discoveries
-DISCOVERIES = [
-    {
-        "id": "crystal_cave",
-        "name": "Crystal Cave",
-        "type": "resource",
-        "x": 2,
-        "y": 0,
-        "resource": "crystals",
-        "description": "Strange formations glitter in the dark"
-    },
-    {
-        "id": "water_source",
-        "name": "Underground Spring",
-        "type": "resource",
-        "x": 0,
-        "y": -1,
-        "resource": "water",
-        "description": "Clean water seeps from the rock"
-    },
-    {
-        "id": "bone_pit",
-        "name": "Ancient Bones",
-        "type": "mystery",
-        "x": -2,
-        "y": 0,
-        "resource": "bones",
-        "description": "The remains of something large"
-    },
-    {
-        "id": "root_network",
-        "name": "Root Network",
-        "type": "organic",
-        "x": 0,
-        "y": 2,
-        "resource": "sap",
-        "description": "Thick roots from the surface, dripping with sap"
-    },
-    {
-        "id": "ore_vein",
-        "name": "Glittering Vein",
-        "type": "resource",
-        "x": -1,
-        "y": -1,
-        "resource": "ore",
-        "description": "Veins of copper and gold thread through the stone"
-    }
-]
+DISCOVERIES = (
+    Discovery(
+        id="crystal_cave",
+        name="Crystal Cave",
+        type="resource",
+        x=2,
+        y=0,
+        resource="crystals",
+        description="Strange formations glitter in the dark",
+    ),
+    Discovery(
+        id="water_source",
+        name="Underground Spring",
+        type="resource",
+        x=0,
+        y=-1,
+        resource="water",
+        description="Clean water seeps from the rock",
+    ),
+    Discovery(
+        id="bone_pit",
+        name="Ancient Bones",
+        type="mystery",
+        x=-2,
+        y=0,
+        resource="bones",
+        description="The remains of something large",
+    ),
+    Discovery(
+        id="root_network",
+        name="Root Network",
+        type="organic",
+        x=0,
+        y=2,
+        resource="sap",
+        description="Thick roots from the surface, dripping with sap",
+    ),
+    Discovery(
+        id="ore_vein",
+        name="Glittering Vein",
+        type="resource",
+        x=-1,
+        y=-1,
+        resource="ore",
+        description="Veins of copper and gold thread through the stone",
+    ),
+)
+
+# Lookup tables, built once
+_DISCOVERY_BY_ID = {d.id: d for d in DISCOVERIES}
+_DISCOVERY_IDS = frozenset(_DISCOVERY_BY_ID)
 
 _bus = None
+_log = get_logger(PLUGIN_ID)
 _discovery_offered = False
 _discovered_tiles = set()
 
@@ -62,6 +82,9 @@ def on_tick(payload: dict):
     """Check for exploration opportunities."""
     global _discovery_offered
 
+    # Nothing to do while an offer is pending or everything is claimed
+    if _discovery_offered or len(_discovered_tiles) >= len(DISCOVERIES):
+        return
 
     state = payload
 
@@ -70,55 +93,55 @@ def on_tick(payload: dict):
     discoveries_allowed = int(dirt // 1000)
     current_discoveries = len(_discovered_tiles)
 
-    if discoveries_allowed > current_discoveries and not _discovery_offered:
+    if discoveries_allowed > current_discoveries:
         # Offer a discovery
-        available = [d for d in DISCOVERIES if d["id"] not in _discovered_tiles]
+        available = _DISCOVERY_IDS - _discovered_tiles
         if available:
-            discovery = random.choice(available)
+            discovery = _DISCOVERY_BY_ID[random.choice(sorted(available))]
             _discovery_offered = True
 
             _bus.emit("card_drawn", {
-                "id": f"discover_{discovery['id']}",
+                "id": f"discover_{discovery.id}",
                 "type": "exploration",
-                "prompt": f"The diggers have found something. At ({discovery['x']}, {discovery['y']}), there is {discovery['description'].lower()}. This could be {discovery['name']}. Do you claim this tile?",
-                "discovery": discovery,
+                "prompt": f"The diggers have found something. At ({discovery.x}, {discovery.y}), there is {discovery.description.lower()}. This could be {discovery.name}. Do you claim this tile?",
+                "discovery": asdict(discovery),
                 "requirements": {
                     "minimum_specs": ["Decide whether to claim the tile"],
                     "completion": {"decision_made": True}
                 }
             })
-            print(f"[exploration] discovered: {discovery['name']}")
+            _log.info("discovered: %s", discovery.name)
 
 
 def claim_discovery(discovery_id: str, state: dict) -> dict:
     """Claim a discovered tile."""
     global _discovery_offered, _discovered_tiles
 
-    discovery = next((d for d in DISCOVERIES if d["id"] == discovery_id), None)
+    discovery = _DISCOVERY_BY_ID.get(discovery_id)
     if not discovery:
         return state
 
     # Add tile to map
-    state["map"]["tiles"][discovery["id"]] = {
-        "name": discovery["name"],
-        "type": discovery["type"],
-        "x": discovery["x"],
-        "y": discovery["y"],
-        "resource": discovery["resource"],
-        "description": discovery["description"]
+    state["map"]["tiles"][discovery.id] = {
+        "name": discovery.name,
+        "type": discovery.type,
+        "x": discovery.x,
+        "y": discovery.y,
+        "resource": discovery.resource,
+        "description": discovery.description
     }
 
     # Connect to origin
-    state["map"]["connections"].append(["origin", discovery["id"]])
+    state["map"]["connections"].append(["origin", discovery.id])
 
     # Initialize the resource
-    if discovery["resource"] not in state["resources"]:
-        state["resources"][discovery["resource"]] = 0
+    if discovery.resource not in state["resources"]:
+        state["resources"][discovery.resource] = 0
 
     _discovered_tiles.add(discovery_id)
     _discovery_offered = False
 
-    print(f"[exploration] claimed: {discovery['name']}")
+    _log.info("claimed: %s", discovery.name)
 
     return state
 
@@ -130,9 +153,7 @@ def register(bus, state):
     bus.register("tick", on_tick, PLUGIN_ID)
 
     # Track already discovered tiles
-    for tile_id in state.get("map", {}).get("tiles", {}):
-        if tile_id in [d["id"] for d in DISCOVERIES]:
-            _discovered_tiles.add(tile_id)
+    _discovered_tiles.update(_DISCOVERY_IDS & state.get("map", {}).get("tiles", {}).keys())
 
 
 def unregister(bus):
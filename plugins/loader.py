@@ -1,17 +1,48 @@
 """Plugin loader. Discovers and loads plugins from the plugins directory."""
 
 import importlib
-import importlib.util
+import itertools
+import os
 from pathlib import Path
 from engine.bus import bus
+from engine.log import flush_logs
 from engine.state import load_state
 
 PLUGINS_DIR = Path(__file__).parent
 LOADED_PLUGINS = {}
 
+_dir_index = {}  # directory -> (st_mtime_ns, plugin paths)
 
-def load_plugin(plugin_path: Path):
-    """Load a single plugin from a Python file."""
+
+def _plugin_paths(directory: Path) -> list:
+    """Plugin files in a directory, rescanned only when its mtime changes."""
+    try:
+        mtime = directory.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    cached = _dir_index.get(directory)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with os.scandir(directory) as it:
+        paths = [
+            Path(e.path) for e in it
+            if e.name.endswith('.py') and not e.name.startswith('_')
+            and e.name != 'loader.py' and e.is_file()
+        ]
+    _dir_index[directory] = (mtime, paths)
+    return paths
+
+
+def load_plugin(plugin_path: Path, state: dict = None, reload: bool = False):
+    """Load a single plugin from a Python file.
+
+    Plugins are imported as modules of this package (plugins.queen,
+    plugins.cards.wave_two, ...), so repeat imports come from sys.modules
+    and reload=True re-executes the module in place. Pass `state` to share
+    one load_state() across many plugins.
+    """
     if not plugin_path.suffix == '.py':
         return None
     if plugin_path.name.startswith('_'):
@@ -22,19 +53,23 @@ def load_plugin(plugin_path: Path):
     module_name = plugin_path.stem
 
     try:
-        spec = importlib.util.spec_from_file_location(module_name, plugin_path)
-        if spec is None or spec.loader is None:
-            print(f"[loader] ERROR: failed to create spec for {module_name}")
-            return None
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        parts = plugin_path.resolve().relative_to(PLUGINS_DIR.resolve()).with_suffix('').parts
+        module = importlib.import_module('.'.join((__package__, *parts)))
+        if reload:
+            module = importlib.reload(module)
 
         plugin_id = getattr(module, 'PLUGIN_ID', module_name)
 
+        # A second copy of a plugin would register every handler twice
+        if plugin_id in LOADED_PLUGINS:
+            print(f"[loader] WARNING: {plugin_id} already loaded, skipping {plugin_path}")
+            return None
+
         if hasattr(module, 'register'):
-            state = load_state()
+            if state is None:
+                state = load_state()
             module.register(bus, state)
+            flush_logs()
             print(f"[loader] registered plugin: {plugin_id}")
 
         LOADED_PLUGINS[plugin_id] = module
@@ -50,21 +85,18 @@ def load_plugin(plugin_path: Path):
 def load_all_plugins():
     """Load all plugins from the plugins directory."""
     loaded = []
-
-    # Load top-level plugins
-    for plugin_path in PLUGINS_DIR.glob('*.py'):
-        plugin_id = load_plugin(plugin_path)
+    state = load_state()
+
+    # Top-level plugins, then card plugins
+    plugin_paths = itertools.chain(
+        _plugin_paths(PLUGINS_DIR),
+        _plugin_paths(PLUGINS_DIR / 'cards'),
+    )
+    for plugin_path in plugin_paths:
+        plugin_id = load_plugin(plugin_path, state)
         if plugin_id:
             loaded.append(plugin_id)
 
-    # Load card plugins
-    cards_dir = PLUGINS_DIR / 'cards'
-    if cards_dir.exists():
-        for plugin_path in cards_dir.glob('*.py'):
-            plugin_id = load_plugin(plugin_path)
-            if plugin_id:
-                loaded.append(plugin_id)
-
     return loaded
 
 
@@ -84,5 +116,5 @@ def reload_plugin(plugin_id: str):
         module = LOADED_PLUGINS[plugin_id]
         plugin_path = Path(module.__file__)
         unload_plugin(plugin_id)
-        return load_plugin(plugin_path)
+        return load_plugin(plugin_path, reload=True)
     return None
@@ -6,34 +6,54 @@ They exist solely to be observed.
 In exchange for their uselessness, they generate Influence.
 """
 
+from dataclasses import dataclass
+
+from engine.log import get_logger
+from engine.state import entity_index
+
 PLUGIN_ID = "ornamentation"
 
+
+@dataclass(frozen=True, slots=True)
+class Jewelry:
+    name: str
+    cost: dict
+    influence_rate: float
+    description: str
+
+
 # Jewelry types and their costs
 JEWELRY = {
-    "copper_ring": {
-        "name": "Copper Ring",
-        "cost": {"ore": 1},
-        "influence_rate": 0.001,
-        "description": "A simple band of copper, wrapped around an antenna"
-    },
-    "gold_band": {
-        "name": "Gold Band",
-        "cost": {"ore": 2},
-        "influence_rate": 0.002,
-        "description": "A heavier ring, catching light with every movement"
-    },
-    "jeweled_crown": {
-        "name": "Jeweled Crown",
-        "cost": {"ore": 3, "crystals": 1},
-        "influence_rate": 0.005,
-        "description": "Crystal fragments set in metal, worn like a halo"
-    }
+    "copper_ring": Jewelry(
+        name="Copper Ring",
+        cost={"ore": 1},
+        influence_rate=0.001,
+        description="A simple band of copper, wrapped around an antenna",
+    ),
+    "gold_band": Jewelry(
+        name="Gold Band",
+        cost={"ore": 2},
+        influence_rate=0.002,
+        description="A heavier ring, catching light with every movement",
+    ),
+    "jeweled_crown": Jewelry(
+        name="Jeweled Crown",
+        cost={"ore": 3, "crystals": 1},
+        influence_rate=0.005,
+        description="Crystal fragments set in metal, worn like a halo",
+    ),
 }
 
 # The hunger multiplier for adorned ants
 ADORNMENT_HUNGER_MULTIPLIER = 3
 
+# Rebuild the adorned-ant table from state this often, to pick up ants
+# adorned without an ant_adorned event
+RESYNC_INTERVAL_TICKS = 600
+
 _bus = None
+_log = get_logger(PLUGIN_ID)
+_adorned = {}  # Living adorned entity id -> influence rate
 
 
 def can_craft_jewelry(state: dict, jewelry_type: str) -> bool:
@@ -42,7 +62,7 @@ def can_craft_jewelry(state: dict, jewelry_type: str) -> bool:
         return False
 
     jewelry = JEWELRY[jewelry_type]
-    for resource, amount in jewelry["cost"].items():
+    for resource, amount in jewelry.cost.items():
         if state["resources"].get(resource, 0) < amount:
             return False
 
@@ -57,7 +77,7 @@ def craft_jewelry(state: dict, jewelry_type: str) -> dict:
     jewelry = JEWELRY[jewelry_type]
 
     # Consume resources
-    for resource, amount in jewelry["cost"].items():
+    for resource, amount in jewelry.cost.items():
         state["resources"][resource] -= amount
 
     # Add to jewelry inventory
@@ -68,12 +88,12 @@ def craft_jewelry(state: dict, jewelry_type: str) -> dict:
 
     state["meta"]["jewelry"].append({
         "type": jewelry_type,
-        "name": jewelry["name"],
+        "name": jewelry.name,
         "created_tick": state["tick"],
         "worn_by": None
     })
 
-    print(f"[ornamentation] crafted {jewelry['name']}")
+    _log.info("crafted %s", jewelry.name)
     _bus.emit("jewelry_crafted", {
         "type": jewelry_type,
         "tick": state["tick"]
@@ -88,27 +108,22 @@ def adorn_ant(state: dict, entity_id: str, jewelry_index: int) -> dict:
     jewelry_list = meta.get("jewelry", [])
 
     if jewelry_index >= len(jewelry_list):
-        print(f"[ornamentation] no jewelry at index {jewelry_index}")
+        _log.warning("no jewelry at index %s", jewelry_index)
         return state
 
     jewelry = jewelry_list[jewelry_index]
     if jewelry.get("worn_by") is not None:
-        print("[ornamentation] jewelry already worn")
+        _log.warning("jewelry already worn")
         return state
 
     # Find the entity
-    entity = None
-    for e in state["entities"]:
-        if e["id"] == entity_id:
-            entity = e
-            break
-
+    entity = entity_index(state).get(entity_id)
     if entity is None:
-        print(f"[ornamentation] entity {entity_id} not found")
+        _log.warning("entity %s not found", entity_id)
         return state
 
     if entity.get("adorned"):
-        print(f"[ornamentation] entity {entity_id} already adorned")
+        _log.warning("entity %s already adorned", entity_id)
         return state
 
     # The transformation
@@ -117,15 +132,15 @@ def adorn_ant(state: dict, entity_id: str, jewelry_index: int) -> dict:
     entity["adorned"] = True
     entity["ornament"] = jewelry["type"]
     entity["hunger_rate"] = entity.get("hunger_rate", 0.1) * ADORNMENT_HUNGER_MULTIPLIER
-    entity["influence_rate"] = JEWELRY[jewelry["type"]]["influence_rate"]
+    entity["influence_rate"] = JEWELRY[jewelry["type"]].influence_rate
 
     # Mark jewelry as worn
     jewelry["worn_by"] = entity_id
     jewelry["worn_tick"] = state["tick"]
 
     original_role = entity.get("role", "worker")
-    print(f"[ornamentation] {entity_id} adorned with {jewelry['name']}")
-    print(f"[ornamentation] {entity_id} was {original_role}, now adorned (generates influence)")
+    _log.info("%s adorned with %s", entity_id, jewelry['name'])
+    _log.info("%s was %s, now adorned (generates influence)", entity_id, original_role)
 
     _bus.emit("ant_adorned", {
         "entity_id": entity_id,
@@ -137,13 +152,29 @@ def adorn_ant(state: dict, entity_id: str, jewelry_index: int) -> dict:
     return state
 
 
+def sync_adorned(state: dict):
+    """Rebuild the adorned-ant table from the entities in state."""
+    _adorned.clear()
+    for entity in state.get("entities", []):
+        if entity.get("adorned") and entity.get("influence_rate"):
+            _adorned[entity["id"]] = entity["influence_rate"]
+
+
+def prune_adorned(state: dict):
+    """Drop adorned ants that are no longer in state.
+
+    Not every death reaches the bus as a death event (the Rust core's
+    events arrive wrapped and are emitted as unknown_event), so the entity
+    list is the source of truth.
+    """
+    living = {e["id"] for e in state.get("entities", [])}
+    for entity_id in [i for i in _adorned if i not in living]:
+        del _adorned[entity_id]
+
+
 def generate_influence(state: dict) -> dict:
     """Generate influence from adorned ants. Called each tick."""
-    influence_generated = 0
-
-    for entity in state["entities"]:
-        if entity.get("adorned") and entity.get("influence_rate"):
-            influence_generated += entity["influence_rate"]
+    influence_generated = sum(_adorned.values())
 
     if influence_generated > 0:
         state["resources"]["influence"] = state["resources"].get("influence", 0) + influence_generated
@@ -152,16 +183,31 @@ def generate_influence(state: dict) -> dict:
 
 
 def on_tick(payload: dict):
-    """Process influence generation each tick."""
-    from engine.state import load_state, save_state
+    """Process influence generation each tick. Mutates the live tick state."""
+    state = payload
 
-    state = load_state()
+    if state.get("tick", 0) % RESYNC_INTERVAL_TICKS == 0:
+        sync_adorned(state)
 
-    # Only process if we have adorned ants
-    has_adorned = any(e.get("adorned") for e in state.get("entities", []))
-    if has_adorned:
-        state = generate_influence(state)
-        save_state(state)
+    # Only process if we have adorned ants, and only the living ones
+    if _adorned:
+        prune_adorned(state)
+        generate_influence(state)
+
+
+def on_ant_adorned(payload: dict):
+    """Start counting a newly adorned ant (from here or auto_ornamental)."""
+    entity_id = payload.get("entity_id") or payload.get("ant_id")
+    jewelry_type = payload.get("jewelry_type") or payload.get("ornament")
+    jewelry = JEWELRY.get(jewelry_type)
+    if entity_id and jewelry:
+        _adorned[entity_id] = jewelry.influence_rate
+
+
+def on_entity_death(payload: dict):
+    """Stop counting an ant once it dies."""
+    entity_id = payload.get("entity_id") or payload.get("entity", {}).get("id")
+    _adorned.pop(entity_id, None)
 
 
 def register(bus, state):
@@ -169,12 +215,17 @@ def register(bus, state):
     global _bus
     _bus = bus
     bus.register("tick", on_tick, PLUGIN_ID)
+    bus.register("ant_adorned", on_ant_adorned, PLUGIN_ID)
+    bus.register("entity_death", on_entity_death, PLUGIN_ID)
+    bus.register("entity_died", on_entity_death, PLUGIN_ID)
+
+    sync_adorned(state)
 
     # Initialize influence resource if not present
     if "influence" not in state.get("resources", {}):
         state["resources"]["influence"] = 0
 
-    print("[ornamentation] The cost of beauty awaits")
+    _log.info("The cost of beauty awaits")
 
 
 def unregister(bus):
@@ -18,18 +18,51 @@ VIEWER_CONCERNS = [
     "watchability",      # Would YOU leave this on in the background?
 ]
 
-def build_producer_prompt(state: dict) -> str:
+
+def _summarize(state: dict) -> dict:
+    """One pass over entities and jewelry for everything the Producer counts."""
+    ant_roles = []
+    visitor_count = 0
+    living_ids = set()
+
+    for e in state.get("entities", []):
+        living_ids.add(e["id"])
+        kind = e.get("type")
+        if kind == "ant":
+            ant_roles.append(e.get("role"))
+        elif kind == "visitor":
+            visitor_count += 1
+
+    # Unworn pieces count as ghosts in the prompt; the viewer state only
+    # counts pieces whose wearer has died.
+    unclaimed = 0
+    ghost_jewelry_count = 0
+    for j in state.get("meta", {}).get("jewelry", []):
+        worn_by = j.get("worn_by")
+        if worn_by not in living_ids:
+            unclaimed += 1
+            if worn_by:
+                ghost_jewelry_count += 1
+
+    return {
+        "entity_count": len(living_ids),
+        "ant_count": len(ant_roles),
+        "ant_roles": ant_roles,
+        "visitor_count": visitor_count,
+        "unclaimed_jewelry_count": unclaimed,
+        "ghost_jewelry_count": ghost_jewelry_count,
+    }
+
+
+def build_producer_prompt(state: dict, summary: dict | None = None) -> str:
     """Build the prompt for the Producer subagent."""
 
     tick = state.get("tick", 0)
-    entities = state.get("entities", [])
     resources = state.get("resources", {})
     meta = state.get("meta", {})
     systems = state.get("systems", {})
     graveyard = state.get("graveyard", {})
-
-    ants = [e for e in entities if e.get("type") == "ant"]
-    visitors = [e for e in entities if e.get("type") == "visitor"]
+    summary = summary or _summarize(state)
 
     return f"""You are The Producer - a well-meaning TV producer who's been brought in to
 consult on "The Listening Hill", a live ant colony simulation that streams 24/7.
@@ -40,8 +73,8 @@ Your job is to suggest ONE improvement to the viewer that would make it more eng
 ## Current Production Status (tick {tick:,})
 
 **The Cast:**
-- {len(ants)} ants on screen (roles: {[a.get('role') for a in ants]})
-- {len(visitors)} visitors currently
+- {summary['ant_count']} ants on screen (roles: {summary['ant_roles']})
+- {summary['visitor_count']} visitors currently
 - {len(graveyard.get('corpses', []))} bodies awaiting processing (drama!)
 
 **The Set:**
@@ -51,7 +84,7 @@ Your job is to suggest ONE improvement to the viewer that would make it more eng
 **The Mood:**
 - Colony sanity: {meta.get('sanity', 100):.1f}% {"(CRISIS MODE - this is GREAT for tension!)" if meta.get('sanity_crisis') else ""}
 - Boredom index: {meta.get('boredom', 0)}
-- Ghost jewelry count: {len([j for j in meta.get('jewelry', []) if j.get('worn_by') not in [e['id'] for e in entities]])} pieces (haunting imagery!)
+- Ghost jewelry count: {summary['unclaimed_jewelry_count']} pieces (haunting imagery!)
 
 ## Current Viewer Features
 
@@ -81,29 +114,26 @@ Key files: renderer/tiles.ts, renderer/entities.ts, renderer/particles.ts, ui/pa
 """
 
 
-def gather_viewer_state(state: dict) -> dict:
+def gather_viewer_state(state: dict, summary: dict | None = None) -> dict:
     """Collect state relevant to viewer analysis."""
-    entities = state.get("entities", [])
     meta = state.get("meta", {})
-
-    living_ids = {e["id"] for e in entities}
-    ghost_jewelry = [j for j in meta.get("jewelry", [])
-                     if j.get("worn_by") and j["worn_by"] not in living_ids]
+    summary = summary or _summarize(state)
 
     return {
         "tick": state.get("tick", 0),
-        "entity_count": len(entities),
-        "ant_roles": [e.get("role") for e in entities if e.get("type") == "ant"],
-        "visitor_count": len([e for e in entities if e.get("type") == "visitor"]),
+        "entity_count": summary["entity_count"],
+        "ant_roles": summary["ant_roles"],
+        "visitor_count": summary["visitor_count"],
         "system_count": len(state.get("systems", {})),
         "resource_types": list(state.get("resources", {}).keys()),
         "sanity": meta.get("sanity", 100),
         "sanity_crisis": meta.get("sanity_crisis", False),
         "boredom": meta.get("boredom", 0),
         "pending_corpses": len(state.get("graveyard", {}).get("corpses", [])),
-        "ghost_jewelry_count": len(ghost_jewelry),
+        "ghost_jewelry_count": summary["ghost_jewelry_count"],
         "blighted_tiles": [
             name for name, tile in state.get("map", {}).get("tiles", {}).items()
             if tile.get("blighted")
         ],
     }
+
@@ -4,7 +4,10 @@ A queen ant produces new workers and undertakers periodically,
 consuming nutrients and fungus. Without a queen, the colony dies.
 """
 
-import uuid
+import itertools
+import time
+
+from engine.log import get_logger
 
 PLUGIN_ID = "queen"
 
@@ -15,6 +18,11 @@ SPAWN_COST_FUNGUS = 10
 MIN_RESOURCES_TO_SPAWN = 15  # Safety buffer
 
 _bus = None
+_log = get_logger(PLUGIN_ID)
+
+# Ant ids are 8 hex digits from a counter seeded with the start time, so
+# ids from separate runs don't overlap
+_id_counter = itertools.count(int(time.time()) & 0xFFFFFFFF)
 
 
 def get_last_spawn_tick(state: dict) -> int:
@@ -29,10 +37,7 @@ def set_last_spawn_tick(state: dict, tick: int):
     state["meta"]["last_queen_spawn_tick"] = tick
 
 
-def spawn_ant(state: dict, role: str) -> dict:
-    """Create a new ant entity."""
-    ant_id = str(uuid.uuid4())[:8]
-
+def _new_ant(ant_id: str, role: str) -> dict:
     ant = {
         "id": ant_id,
         "type": "ant",
@@ -49,12 +54,26 @@ def spawn_ant(state: dict, role: str) -> dict:
         ant["processing_corpse"] = False
         ant["processing_ticks"] = 0
 
-    state["entities"].append(ant)
-    print(f"[queen] spawned {role} {ant_id} at origin")
+    return ant
+
+
+def spawn_ants(state: dict, roles) -> dict:
+    """Create one new ant entity per role, in a single batch."""
+    ants = [
+        _new_ant(format(next(_id_counter) & 0xFFFFFFFF, '08x'), role)
+        for role in roles
+    ]
+    state["entities"].extend(ants)
+    _log.info("spawned %s at origin", ", ".join(f"{a['role']} {a['id']}" for a in ants))
 
     return state
 
 
+def spawn_ant(state: dict, role: str) -> dict:
+    """Create a new ant entity."""
+    return spawn_ants(state, (role,))
+
+
 def check_queen_spawning(state: dict) -> dict:
     """Check if it's time to spawn new ants."""
     # Don't spawn if queen chamber doesn't exist
@@ -66,12 +85,12 @@ def check_queen_spawning(state: dict) -> dict:
     nutrients = state["resources"].get("nutrients", 0)
     fungus = state["resources"].get("fungus", 0)
 
-    # Count only ants, not visitors
-    ant_count = len([e for e in state.get("entities", []) if e.get("type") == "ant"])
+    has_resources = nutrients >= MIN_RESOURCES_TO_SPAWN and fungus >= MIN_RESOURCES_TO_SPAWN
 
-    # Emergency spawn if no ants alive and has resources
-    if ant_count == 0 and nutrients >= MIN_RESOURCES_TO_SPAWN and fungus >= MIN_RESOURCES_TO_SPAWN:
-        print("[queen] EMERGENCY SPAWN - colony is empty")
+    # Emergency spawn if no ants alive (visitors don't count) and has resources.
+    # Resources are checked first, and any() stops at the first living ant.
+    if has_resources and not any(e.get("type") == "ant" for e in state.get("entities", [])):
+        _log.warning("EMERGENCY SPAWN - colony is empty")
         # Fall through to spawn logic below
     else:
         # Check if enough time has passed
@@ -85,13 +104,12 @@ def check_queen_spawning(state: dict) -> dict:
             return state
 
         # Check if enough resources
-        if nutrients < MIN_RESOURCES_TO_SPAWN or fungus < MIN_RESOURCES_TO_SPAWN:
-            print(f"[queen] insufficient resources to spawn (need {MIN_RESOURCES_TO_SPAWN} nutrients and fungus)")
+        if not has_resources:
+            _log.info("insufficient resources to spawn (need %d nutrients and fungus)", MIN_RESOURCES_TO_SPAWN)
             return state
 
     # Spawn new ants
-    state = spawn_ant(state, "worker")
-    state = spawn_ant(state, "undertaker")
+    state = spawn_ants(state, ("worker", "undertaker"))
 
     # Consume resources
     state["resources"]["nutrients"] -= SPAWN_COST_NUTRIENTS
@@ -99,7 +117,7 @@ def check_queen_spawning(state: dict) -> dict:
 
     set_last_spawn_tick(state, tick)
 
-    print(f"[queen] spawned worker and undertaker, consumed {SPAWN_COST_NUTRIENTS} nutrients and {SPAWN_COST_FUNGUS} fungus")
+    _log.info("spawned worker and undertaker, consumed %d nutrients and %d fungus", SPAWN_COST_NUTRIENTS, SPAWN_COST_FUNGUS)
 
     _bus.emit("ants_spawned", {
         "tick": tick,
@@ -112,12 +130,8 @@ def check_queen_spawning(state: dict) -> dict:
 
 
 def on_tick(payload: dict):
-    """Main tick handler for queen system."""
-    from engine.state import load_state, save_state
-
-    state = load_state()
-    state = check_queen_spawning(state)
-    save_state(state)
+    """Main tick handler for queen system. Mutates the live tick state."""
+    check_queen_spawning(payload)
 
 
 def register(bus, state):
@@ -125,7 +139,7 @@ def register(bus, state):
     global _bus
     _bus = bus
     bus.register("tick", on_tick, PLUGIN_ID)
-    print("[queen] The Queen's Chamber is ready")
+    _log.info("The Queen's Chamber is ready")
 
 
 def unregister(bus):
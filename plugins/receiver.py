@@ -5,8 +5,13 @@ The Receiver listens for a response. When enough influence has accumulated,
 something may answer.
 """
 
-import uuid
-import random
+import bisect
+import itertools
+import os
+from collections import defaultdict
+
+from engine.log import get_logger
+from plugins._rng import next_rand
 
 PLUGIN_ID = "receiver"
 
@@ -17,6 +22,7 @@ SUMMON_CHANCE = 0.3  # 30% chance of success per attempt
 LISTENING_DRAIN = 0.0005  # Passive influence consumption while listening
 
 _bus = None
+_log = get_logger(PLUGIN_ID)
 
 
 def get_last_summon_tick(state: dict) -> int:
@@ -61,13 +67,24 @@ VISITOR_TYPES = [
     }
 ]
 
+# Cumulative selection weights (a type's optional "weight", default 1)
+_VISITOR_CUM_WEIGHTS = list(itertools.accumulate(t.get("weight", 1) for t in VISITOR_TYPES))
 
-def spawn_visitor(state: dict, visitor_type: dict) -> dict:
-    """Create a Visitor entity from outside."""
-    visitor_id = "v_" + str(uuid.uuid4())[:6]
 
-    visitor = {
-        "id": visitor_id,
+def choose_visitor_type() -> dict:
+    """Pick a visitor type at random, by weight."""
+    roll = next_rand() * _VISITOR_CUM_WEIGHTS[-1]
+    return VISITOR_TYPES[bisect.bisect(_VISITOR_CUM_WEIGHTS, roll)]
+
+
+def visitors_of(state: dict) -> list:
+    """The visitor entities in state["entities"]."""
+    return [e for e in state.get("entities", []) if e.get("type") == "visitor"]
+
+
+def _visitor_template(visitor_type: dict) -> dict:
+    """Everything about a new visitor of this type except its id."""
+    template = {
         "type": "visitor",
         "subtype": visitor_type["subtype"],
         "name": visitor_type["name"],
@@ -83,14 +100,26 @@ def spawn_visitor(state: dict, visitor_type: dict) -> dict:
 
     # Add special properties
     if "gift_on_death" in visitor_type:
-        visitor["gift_on_death"] = visitor_type["gift_on_death"]
+        template["gift_on_death"] = visitor_type["gift_on_death"]
     if "generates" in visitor_type:
-        visitor["generates"] = visitor_type["generates"]
+        template["generates"] = visitor_type["generates"]
     if "transforms" in visitor_type:
-        visitor["transforms"] = True
+        template["transforms"] = True
+
+    return template
+
+
+# New-visitor templates by subtype, built once
+_VISITOR_TEMPLATES = {t["subtype"]: _visitor_template(t) for t in VISITOR_TYPES}
+
+
+def spawn_visitor(state: dict, visitor_type: dict) -> dict:
+    """Create a Visitor entity from outside."""
+    template = _VISITOR_TEMPLATES.get(visitor_type["subtype"]) or _visitor_template(visitor_type)
+    visitor = {"id": "v_" + os.urandom(3).hex(), **template}
 
     state["entities"].append(visitor)
-    print(f"[receiver] A VISITOR HAS ARRIVED: {visitor_type['name']} ({visitor_type['subtype']})")
+    _log.info("A VISITOR HAS ARRIVED: %s (%s)", visitor_type['name'], visitor_type['subtype'])
 
     return state
 
@@ -113,7 +142,7 @@ def attempt_summoning(state: dict) -> dict:
     state["resources"]["influence"] -= SUMMON_COST
     set_last_summon_tick(state, tick)
 
-    print(f"[receiver] Spent {SUMMON_COST} influence. Broadcasting into the void...")
+    _log.info("Spent %s influence. Broadcasting into the void...", SUMMON_COST)
 
     _bus.emit("influence_spent", {
         "tick": tick,
@@ -122,9 +151,9 @@ def attempt_summoning(state: dict) -> dict:
     })
 
     # Roll for success
-    if random.random() < SUMMON_CHANCE:
+    if next_rand() < SUMMON_CHANCE:
         # Success - something answers
-        visitor_type = random.choice(VISITOR_TYPES)
+        visitor_type = choose_visitor_type()
         state = spawn_visitor(state, visitor_type)
 
         _bus.emit("visitor_arrived", {
@@ -133,109 +162,105 @@ def attempt_summoning(state: dict) -> dict:
             "name": visitor_type["name"]
         })
     else:
-        print("[receiver] The void is silent. No response.")
+        _log.info("The void is silent. No response.")
         _bus.emit("summoning_failed", {"tick": tick})
 
     return state
 
 
-def process_visitors(state: dict) -> dict:
+def process_visitors(state: dict, visitors: list) -> dict:
     """Handle visitor-specific behaviors."""
-    for entity in state["entities"]:
-        if entity.get("type") != "visitor":
-            continue
+    resources = state["resources"]
+    deltas = defaultdict(float)  # Resource changes, applied once at the end
 
+    for entity in visitors:
         # Visitors that generate resources
         if "generates" in entity:
             for resource, rate in entity["generates"].items():
-                state["resources"][resource] = state["resources"].get(resource, 0) + rate
+                deltas[resource] += rate
 
         # Hungry visitors that eat influence
         if entity.get("food") == "influence" and entity.get("hunger", 100) < 50:
-            if state["resources"].get("influence", 0) >= 0.1:
-                state["resources"]["influence"] -= 0.1
+            if resources.get("influence", 0) + deltas.get("influence", 0) >= 0.1:
+                deltas["influence"] -= 0.1
                 entity["hunger"] = min(100, entity["hunger"] + 20)
                 # Transforms influence into something else
                 if entity.get("transforms"):
-                    state["resources"]["strange_matter"] = state["resources"].get("strange_matter", 0) + 0.05
+                    deltas["strange_matter"] += 0.05
+
+    for resource, delta in deltas.items():
+        resources[resource] = resources.get(resource, 0) + delta
 
     return state
 
 
-def handle_visitor_death(state: dict) -> dict:
+def handle_visitor_death(state: dict, visitors: list) -> dict:
     """Check for visitors that should die and handle their gifts."""
-    surviving = []
-
-    for entity in state["entities"]:
-        if entity.get("type") != "visitor":
-            surviving.append(entity)
-            continue
-
-        max_age = entity.get("max_age", 3600)
-        died = entity.get("age", 0) >= max_age
-
-        # Visitors don't starve (except hungry ones)
-        if entity.get("food") == "influence" and entity.get("hunger", 100) <= 0:
-            died = True
-
-        if died:
-            print(f"[receiver] Visitor {entity.get('name', 'unknown')} has departed")
-
-            # Leave gift if they have one
-            if "gift_on_death" in entity:
-                for resource, amount in entity["gift_on_death"].items():
-                    state["resources"][resource] = state["resources"].get(resource, 0) + amount
-                    print(f"[receiver] They left behind: {amount} {resource}")
-
-            _bus.emit("visitor_departed", {
-                "tick": state["tick"],
-                "visitor_id": entity["id"],
-                "name": entity.get("name", "unknown"),
-                "subtype": entity.get("subtype", "unknown")
-            })
-        else:
-            surviving.append(entity)
-
-    state["entities"] = surviving
+    # Visitors leave when old; hungry ones also when starved
+    dead = [
+        e for e in visitors
+        if e.get("age", 0) >= e.get("max_age", 3600)
+        or (e.get("food") == "influence" and e.get("hunger", 100) <= 0)
+    ]
+    if not dead:
+        return state
+
+    for entity in dead:
+        _log.info("Visitor %s has departed", entity.get('name', 'unknown'))
+
+        # Leave gift if they have one
+        if "gift_on_death" in entity:
+            for resource, amount in entity["gift_on_death"].items():
+                state["resources"][resource] = state["resources"].get(resource, 0) + amount
+                _log.info("They left behind: %s %s", amount, resource)
+
+        _bus.emit("visitor_departed", {
+            "tick": state["tick"],
+            "visitor_id": entity["id"],
+            "name": entity.get("name", "unknown"),
+            "subtype": entity.get("subtype", "unknown")
+        })
+
+    dead_ids = {e["id"] for e in dead}
+    state["entities"] = [e for e in state["entities"] if e["id"] not in dead_ids]
+
     return state
 
 
 def check_maintenance(state: dict) -> dict:
     """Check if Receiver needs maintenance, apply degradation if unmaintained."""
     tick = state["tick"]
-    goals = state.get("meta", {}).get("goals", {})
-    maint_goal = goals.get("receiver_maintenance", {})
+    meta = state.get("meta", {})
+    maint_goal = meta.get("goals", {}).get("receiver_maintenance", {})
 
     if not maint_goal:
         return state
 
+    resources = state["resources"]
     last_maintained = maint_goal.get("last_maintained", tick)
     interval = maint_goal.get("maintenance_interval_ticks", 3600)
     ticks_since_maint = tick - last_maintained
 
-    # Auto-maintain if we have strange_matter
-    if ticks_since_maint >= interval:
-        strange_matter = state["resources"].get("strange_matter", 0)
-
-        if strange_matter >= 1:
-            # Consume strange_matter to maintain
-            state["resources"]["strange_matter"] -= 1
-            state["meta"]["goals"]["receiver_maintenance"]["last_maintained"] = tick
-            print("[receiver] Consumed 1 strange_matter for maintenance. The antenna hums with power.")
-        else:
-            # No fuel - Receiver goes silent
-            if not state["meta"].get("receiver_silent", False):
-                state["meta"]["receiver_silent"] = True
-                state["meta"]["receiver_failed_tick"] = tick
-                print("[receiver] WARNING: No strange_matter for maintenance. The antenna begins to fade...")
-
-    # If silent and we now have strange_matter, allow manual reactivation
-    if state["meta"].get("receiver_silent") and state["resources"].get("strange_matter", 0) >= 1:
+    is_silent = meta.get("receiver_silent", False)
+    has_fuel = resources.get("strange_matter", 0) >= 1
+    due = ticks_since_maint >= interval
+
+    if is_silent and has_fuel:
         # Auto-restore if strange_matter becomes available
-        state["resources"]["strange_matter"] -= 1
-        state["meta"]["receiver_silent"] = False
-        state["meta"]["goals"]["receiver_maintenance"]["last_maintained"] = tick
-        print("[receiver] The antenna ROARS back to life! Connection restored.")
+        resources["strange_matter"] -= 1
+        meta["receiver_silent"] = False
+        maint_goal["last_maintained"] = tick
+        _log.info("The antenna ROARS back to life! Connection restored.")
+    elif due and has_fuel:
+        # Auto-maintain: consume strange_matter
+        resources["strange_matter"] -= 1
+        maint_goal["last_maintained"] = tick
+        _log.info("Consumed 1 strange_matter for maintenance. The antenna hums with power.")
+    elif due and not is_silent:
+        # No fuel - Receiver goes silent
+        meta["receiver_silent"] = True
+        meta["receiver_failed_tick"] = tick
+        _log.warning("WARNING: No strange_matter for maintenance. The antenna begins to fade...")
 
     return state
 
@@ -247,12 +272,12 @@ def check_bootstrap_mode(state: dict) -> dict:
     Only works when Receiver is silent.
     One-time emergency measure when the strange_matter loop is broken.
     """
-    if not state.get("meta", {}).get("receiver_silent", False):
+    meta = state.get("meta", {})
+    if not meta.get("receiver_silent", False):
         return state  # Not silent, no bootstrap needed
 
     # Check if we have resources for bootstrap
     resources = state.get("resources", {})
-    meta = state.get("meta", {})
 
     ore = resources.get("ore", 0)
     crystals = resources.get("crystals", 0)
@@ -276,35 +301,34 @@ def check_bootstrap_mode(state: dict) -> dict:
         # Must be silent for at least 5 minutes AND haven't bootstrapped in last hour
         if tick - failed_tick >= 300 and tick - last_bootstrap_tick >= 3600:
             # Perform bootstrap
-            state["resources"]["ore"] -= BOOTSTRAP_ORE
-            state["resources"]["crystals"] -= BOOTSTRAP_CRYSTALS
+            resources["ore"] -= BOOTSTRAP_ORE
+            resources["crystals"] -= BOOTSTRAP_CRYSTALS
             if sanity_requirement > 0:
-                state["meta"]["sanity"] -= BOOTSTRAP_SANITY
-            state["meta"]["receiver_silent"] = False
-            state["meta"]["receiver_bootstrap_tick"] = tick
+                meta["sanity"] -= BOOTSTRAP_SANITY
+            meta["receiver_silent"] = False
+            meta["receiver_bootstrap_tick"] = tick
 
             if sanity_requirement == 0:
-                print("[receiver] EMERGENCY BOOTSTRAP ACTIVATED - DESPERATION MODE!")
-                print(f"[receiver] Consumed: {BOOTSTRAP_ORE} ore, {BOOTSTRAP_CRYSTALS} crystals (sanity already broken)")
-                print("[receiver] When you have nothing left to lose, even the void listens.")
+                _log.warning("EMERGENCY BOOTSTRAP ACTIVATED - DESPERATION MODE!")
+                _log.info("Consumed: %d ore, %d crystals (sanity already broken)", BOOTSTRAP_ORE, BOOTSTRAP_CRYSTALS)
+                _log.info("When you have nothing left to lose, even the void listens.")
             else:
-                print("[receiver] EMERGENCY BOOTSTRAP ACTIVATED!")
-                print(f"[receiver] Consumed: {BOOTSTRAP_ORE} ore, {BOOTSTRAP_CRYSTALS} crystals, {BOOTSTRAP_SANITY} sanity")
-                print("[receiver] The antenna flickers, powered by desperation and precious metals.")
-            print("[receiver] Connection to the Outside: RESTORED")
+                _log.warning("EMERGENCY BOOTSTRAP ACTIVATED!")
+                _log.info("Consumed: %d ore, %d crystals, %d sanity", BOOTSTRAP_ORE, BOOTSTRAP_CRYSTALS, BOOTSTRAP_SANITY)
+                _log.info("The antenna flickers, powered by desperation and precious metals.")
+            _log.info("Connection to the Outside: RESTORED")
 
             # Update maintenance timer
-            if "goals" in state["meta"] and "receiver_maintenance" in state["meta"]["goals"]:
-                state["meta"]["goals"]["receiver_maintenance"]["last_maintained"] = tick
+            maint_goal = meta.get("goals", {}).get("receiver_maintenance")
+            if maint_goal is not None:
+                maint_goal["last_maintained"] = tick
 
     return state
 
 
 def on_tick(payload: dict):
     """Main tick handler for receiver system."""
-    from engine.state import load_state, save_state
-
-    state = load_state()
+    state = payload
 
     # Only operate if receiver exists
     if "receiver" not in state.get("systems", {}):
@@ -318,23 +342,23 @@ def on_tick(payload: dict):
 
     # If receiver is silent (unmaintained), it doesn't work
     if state.get("meta", {}).get("receiver_silent", False):
-        save_state(state)
         return
 
     # Passive listening drain (very small)
-    if state["resources"].get("influence", 0) > LISTENING_DRAIN:
-        state["resources"]["influence"] -= LISTENING_DRAIN
+    resources = state["resources"]
+    if resources.get("influence", 0) > LISTENING_DRAIN:
+        resources["influence"] -= LISTENING_DRAIN
 
     # Attempt summoning if we have enough influence
-    state = attempt_summoning(state)
-
-    # Process visitor behaviors
-    state = process_visitors(state)
-
-    # Handle visitor deaths/departures
-    state = handle_visitor_death(state)
+    if resources.get("influence", 0) >= SUMMON_COST:
+        state = attempt_summoning(state)
 
-    save_state(state)
+    # Visitor behaviors and departures, when there are any. One scan is
+    # shared by both passes.
+    visitors = visitors_of(state)
+    if visitors:
+        state = process_visitors(state, visitors)
+        state = handle_visitor_death(state, visitors)
 
 
 def register(bus, state):
@@ -342,7 +366,7 @@ def register(bus, state):
     global _bus
     _bus = bus
     bus.register("tick", on_tick, PLUGIN_ID)
-    print("[receiver] The Receiver is listening...")
+    _log.info("The Receiver is listening...")
 
 
 def unregister(bus):
@@ -4,7 +4,10 @@ Unlike cards, reflections don't demand decisions. They ask for noticing.
 Reflections fire after significant events, or when stillness accumulates.
 """
 
-import random
+from dataclasses import dataclass
+
+from engine.state import load_state, save_state
+from plugins._rng import next_rand
 
 PLUGIN_ID = "reflection"
 
@@ -26,108 +29,111 @@ PROMPTS = [
 STILLNESS_THRESHOLD = 3000  # ticks of no significant events
 POST_EVENT_DELAY = 300  # ticks after significant event before reflecting
 
+
+@dataclass(slots=True)
+class ReflectionState:
+    last_event: int = 0  # Tick of the last significant event
+    last_reflection: int = 0
+    pending: bool = False  # A significant event is waiting for its aftermath
+    unanswered: int | None = None  # Index in meta.reflections of the newest prompt
+
+
 _bus = None
-_last_significant_event = 0
-_last_reflection = 0
-_pending_reflection = False
+_state = ReflectionState()
 
 
-def on_tick(payload: dict):
-    """Check if reflection is due."""
-    global _pending_reflection, _last_reflection
+def _should_reflect(ticks_since_event: int, pending: bool):
+    """Decide whether to reflect. Returns the trigger name, or None."""
+    if ticks_since_event >= STILLNESS_THRESHOLD:
+        return "stillness"
+    if pending and ticks_since_event >= POST_EVENT_DELAY:
+        return "aftermath"
+    return None
 
-    from engine.state import load_state, save_state
 
+def on_tick(payload: dict):
+    """Check if reflection is due. Records it in the live tick state."""
     state = payload
     tick = state["tick"]
 
     # Don't reflect too often
-    if tick - _last_reflection < STILLNESS_THRESHOLD:
+    if tick - _state.last_reflection < STILLNESS_THRESHOLD:
         return
 
     # Check for stillness or post-event reflection
-    ticks_since_event = tick - _last_significant_event
+    trigger = _should_reflect(tick - _state.last_event, _state.pending)
+    if trigger is None:
+        return
+    if trigger == "aftermath":
+        _state.pending = False
 
-    should_reflect = False
-    trigger = None
+    prompt = PROMPTS[int(next_rand() * len(PROMPTS))]
+    _state.last_reflection = tick
+
+    # Store the reflection prompt in state
+    reflection = {
+        "tick": tick,
+        "trigger": trigger,
+        "prompt": prompt,
+        "response": None  # To be filled by player
+    }
+    meta = state.setdefault("meta", {})
+    reflections = meta.setdefault("reflections", [])
+    reflections.append(reflection)
+    _state.unanswered = len(reflections) - 1
+
+    _bus.emit("reflection_prompt", {
+        "tick": tick,
+        "trigger": trigger,
+        "prompt": prompt
+    })
+
+    print(f"[reflection] ({trigger}) {prompt}")
 
-    if ticks_since_event >= STILLNESS_THRESHOLD:
-        should_reflect = True
-        trigger = "stillness"
-    elif _pending_reflection and ticks_since_event >= POST_EVENT_DELAY:
-        should_reflect = True
-        trigger = "aftermath"
-        _pending_reflection = False
-
-    if should_reflect:
-        prompt = random.choice(PROMPTS)
-        _last_reflection = tick
-
-        # Store the reflection prompt in state
-        disk_state = load_state()
-        if "reflections" not in disk_state["meta"]:
-            disk_state["meta"]["reflections"] = []
-
-        reflection = {
-            "tick": tick,
-            "trigger": trigger,
-            "prompt": prompt,
-            "response": None  # To be filled by player
-        }
-        disk_state["meta"]["reflections"].append(reflection)
-        save_state(disk_state)
-
-        _bus.emit("reflection_prompt", {
-            "tick": tick,
-            "trigger": trigger,
-            "prompt": prompt
-        })
-
-        print(f"[reflection] ({trigger}) {prompt}")
+
+def _mark_significant(payload: dict):
+    _state.last_event = payload.get("tick", 0)
+    _state.pending = True
 
 
 def on_entity_died(payload: dict):
     """Mark death as significant event."""
-    global _last_significant_event, _pending_reflection
-    _last_significant_event = payload.get("tick", 0)
-    _pending_reflection = True
+    _mark_significant(payload)
 
 
 def on_blight_struck(payload: dict):
     """Mark blight as significant event."""
-    global _last_significant_event, _pending_reflection
-    _last_significant_event = payload.get("tick", 0)
-    _pending_reflection = True
+    _mark_significant(payload)
 
 
 def on_blight_cleared(payload: dict):
     """Mark blight clearing as significant event."""
-    global _last_significant_event, _pending_reflection
-    _last_significant_event = payload.get("tick", 0)
-    _pending_reflection = True
+    _mark_significant(payload)
 
 
 def on_threshold(payload: dict):
     """Mark major thresholds as significant."""
-    global _last_significant_event, _pending_reflection
     threshold = payload.get("threshold", 0)
     if threshold >= 100:  # Only major thresholds
-        _last_significant_event = payload.get("tick", 0)
-        _pending_reflection = True
+        _mark_significant(payload)
 
 
 def record_reflection(tick: int, response: str):
     """Record a reflection response."""
-    from engine.state import load_state, save_state
-
     state = load_state()
-    reflections = state["meta"].get("reflections", [])
-
-    # Find the most recent unanswered reflection
-    for r in reversed(reflections):
-        if r["response"] is None:
-            r["response"] = response
-            break
+    meta = state["meta"]
+    reflections = meta.get("reflections", [])
+
+    # The newest reflection is usually the one waiting for an answer
+    idx, _state.unanswered = _state.unanswered, None
+    if idx is not None and idx < len(reflections) and reflections[idx]["response"] is None:
+        reflections[idx]["response"] = response
+    else:
+        # Find the most recent unanswered reflection
+        for r in reversed(reflections):
+            if r["response"] is None:
+                r["response"] = response
+                break
 
     save_state(state)
     print(f"[reflection] recorded: {response[:50]}...")
@@ -135,14 +141,14 @@ def record_reflection(tick: int, response: str):
 
 def register(bus, state):
     """Register handlers."""
-    global _bus, _last_significant_event, _last_reflection
+    global _bus
     _bus = bus
 
     # Initialize from state
-    _last_significant_event = state.get("tick", 0)
+    _state.last_event = state.get("tick", 0)
     reflections = state.get("meta", {}).get("reflections", [])
     if reflections:
-        _last_reflection = reflections[-1].get("tick", 0)
+        _state.last_reflection = reflections[-1].get("tick", 0)
 
     bus.register("tick", on_tick, PLUGIN_ID)
     bus.register("entity_died", on_entity_died, PLUGIN_ID)
@@ -27,6 +27,12 @@ RANDOM_POSITIVE_GAIN = 2  # Random good events
 
 _bus = None
 
+# Event deltas waiting for the next tick
+_pending_delta = 0.0
+_pending_logs = []
+
+_last_bucket = None  # _sanity_bucket() at the last apply_sanity_effects
+
 
 def get_sanity(state: dict) -> float:
     """Get current sanity level."""
@@ -40,130 +46,124 @@ def set_sanity(state: dict, value: float):
     state["meta"]["sanity"] = max(0, min(SANITY_MAX, value))
 
 
-def apply_sanity_effects(state: dict, sanity: float):
-    """Apply consequences of low sanity to systems."""
+def _sanity_bucket(sanity: float) -> int:
+    """0 stable, 1 degraded, 2 crisis, 3 breaking."""
     if sanity >= SANITY_STABLE:
+        return 0
+    if sanity >= SANITY_CRISIS:
+        return 1
+    if sanity >= SANITY_BREAKING:
+        return 2
+    return 3
+
+
+def apply_sanity_effects(state: dict, sanity: float):
+    """Apply consequences of low sanity to systems.
+
+    Efficiency follows sanity every call while below stable; the crisis
+    and breaking markers are only rewritten (and announced) when sanity
+    moves into a different bucket.
+    """
+    global _last_bucket
+
+    bucket = _sanity_bucket(sanity)
+    if bucket == 0 and _last_bucket == 0:
         return  # No effects at healthy sanity
 
     # Below 50: production efficiency drops
-    if sanity < SANITY_STABLE:
+    if bucket > 0:
         efficiency = sanity / SANITY_STABLE  # 0.0 to 1.0
         for system_id, system in state.get("systems", {}).items():
             if system.get("type") == "generator" and "generates" in system:
                 # Mark as degraded (we'll reduce output in tick logic elsewhere)
                 system["sanity_efficiency"] = efficiency
 
+    if bucket == _last_bucket:
+        return
+    _last_bucket = bucket
+
     # Below 25: critical stress marker
-    if sanity < SANITY_CRISIS:
-        state["meta"]["sanity_crisis"] = True
+    state["meta"]["sanity_crisis"] = bucket >= 2
+    if bucket >= 2:
         print(f"[sanity] CRISIS: Colony sanity at {sanity:.1f}. Systems degrading.")
-    else:
-        state["meta"]["sanity_crisis"] = False
 
     # Below 10: breaking point
-    if sanity < SANITY_BREAKING:
-        state["meta"]["sanity_breaking"] = True
+    state["meta"]["sanity_breaking"] = bucket >= 3
+    if bucket >= 3:
         print(f"[sanity] BREAKING: Sanity at {sanity:.1f}. The colony is fracturing.")
-    else:
-        state["meta"]["sanity_breaking"] = False
 
 
 def on_tick(payload: dict):
-    """Apply passive sanity decay."""
-    from engine.state import load_state, save_state
+    """Apply passive decay and this tick's event deltas to the live tick state.
 
-    state = load_state()
-    sanity = get_sanity(state)
+    Event handlers only queue a delta and a message; this applies them all
+    at once.
+    """
+    global _pending_delta
+
+    state = payload
+    meta = state.setdefault("meta", {})
+    sanity = meta.get("sanity", SANITY_MAX)
 
     # Passive decay
     sanity -= PASSIVE_DECAY
 
     # Extra decay if Receiver is silent (isolation)
-    if state.get("meta", {}).get("receiver_silent", False):
+    if meta.get("receiver_silent", False):
         sanity -= ISOLATION_DECAY
         if state["tick"] % 600 == 0:  # Log every 10 minutes
             print(f"[sanity] Isolation weighs heavy. Sanity: {sanity:.1f}")
 
-    set_sanity(state, sanity)
+    # Events since the last tick
+    if _pending_logs:
+        sanity += _pending_delta
+        for message in _pending_logs:
+            print(f"[sanity] {message}")
+        _pending_delta = 0.0
+        _pending_logs.clear()
+
+    # Same clamp as set_sanity()
+    meta["sanity"] = 0 if sanity < 0 else (SANITY_MAX if sanity > SANITY_MAX else sanity)
     apply_sanity_effects(state, sanity)
 
-    save_state(state)
+
+def _queue_delta(delta: float, message: str):
+    global _pending_delta
+    _pending_delta += delta
+    _pending_logs.append(message)
 
 
 def on_entity_died(payload: dict):
     """Sanity hit from death."""
-    from engine.state import load_state, save_state
-
-    state = load_state()
-    sanity = get_sanity(state)
-
     cause = payload.get("cause", "unknown")
     if cause == "starvation":
         penalty = DEATH_PENALTY + STARVATION_PENALTY
-        print(f"[sanity] Death by starvation. The horror. (-{penalty})")
+        _queue_delta(-penalty, f"Death by starvation. The horror. (-{penalty})")
     else:
         penalty = DEATH_PENALTY
-        print(f"[sanity] Death diminishes us. (-{penalty})")
-
-    sanity -= penalty
-    set_sanity(state, sanity)
-    apply_sanity_effects(state, sanity)
-
-    save_state(state)
+        _queue_delta(-penalty, f"Death diminishes us. (-{penalty})")
 
 
 def on_visitor_arrived(payload: dict):
     """Sanity boost from Outside contact."""
-    from engine.state import load_state, save_state
-
-    state = load_state()
-    sanity = get_sanity(state)
-
-    sanity += VISITOR_GAIN
-    print(f"[sanity] The Outside acknowledges us. Hope returns. (+{VISITOR_GAIN})")
-
-    set_sanity(state, sanity)
-    apply_sanity_effects(state, sanity)
-
-    save_state(state)
+    _queue_delta(VISITOR_GAIN, f"The Outside acknowledges us. Hope returns. (+{VISITOR_GAIN})")
 
 
 def on_summoning_failed(payload: dict):
     """Sanity hit from void silence."""
-    from engine.state import load_state, save_state
-
-    state = load_state()
-    sanity = get_sanity(state)
-
-    sanity -= FAILED_SUMMON_PENALTY
-    print(f"[sanity] The void does not answer. (-{FAILED_SUMMON_PENALTY})")
-
-    set_sanity(state, sanity)
-    apply_sanity_effects(state, sanity)
-
-    save_state(state)
+    _queue_delta(-FAILED_SUMMON_PENALTY, f"The void does not answer. (-{FAILED_SUMMON_PENALTY})")
 
 
 def on_blight_struck(payload: dict):
     """Sanity hit from blight contamination."""
-    from engine.state import load_state, save_state
-
-    state = load_state()
-    sanity = get_sanity(state)
-
-    sanity -= BLIGHT_PENALTY
-    print(f"[sanity] The blight spreads. Corruption seeps. (-{BLIGHT_PENALTY})")
-
-    set_sanity(state, sanity)
-    apply_sanity_effects(state, sanity)
-
-    save_state(state)
+    _queue_delta(-BLIGHT_PENALTY, f"The blight spreads. Corruption seeps. (-{BLIGHT_PENALTY})")
 
 
 def register(bus, state):
     """Register handlers."""
-    global _bus
+    global _bus, _last_bucket
     _bus = bus
+    _last_bucket = None
 
     # Initialize sanity if not present
     if "meta" not in state:
@@ -6,6 +6,8 @@ Contamination risks blight events that shut down the tile.
 """
 
 import random
+from collections import deque
+from operator import itemgetter
 
 PLUGIN_ID = "undertaker"
 
@@ -18,6 +20,13 @@ BLIGHT_DURATION = 300          # How long blight lasts
 UNDERTAKER_STARVATION_PENALTY = 0.05  # Extra hunger rate for undertakers
 
 _bus = None
+# Live corpse boosts as (expires_at_tick, bonus), oldest first, and their
+# summed bonus. Kept here rather than read back from state: under the Rust
+# core the boost list is a fresh copy every tick, already expired by Rust.
+_boosts = deque()
+_boost_total = 0.0
+
+_expiry = itemgetter("expires_at_tick")
 
 
 def on_entity_died(payload: dict):
@@ -27,37 +36,79 @@ def on_entity_died(payload: dict):
     print(f"[undertaker] {entity.get('type')} died of {cause}")
 
 
-def process_undertakers(state: dict) -> dict:
+def sync_boosts(compost_system: dict):
+    """Rebuild the running boost total from the saved corpse_boosts list."""
+    global _boost_total
+    saved = sorted(compost_system.get("corpse_boosts", []), key=_expiry)
+    _boosts.clear()
+    _boosts.extend((b["expires_at_tick"], b["bonus"]) for b in saved)
+    _boost_total = sum(bonus for _, bonus in _boosts)
+
+
+def clear_boosts(compost_system: dict):
+    """Drop every corpse boost (blight)."""
+    global _boost_total
+    compost_system["corpse_boosts"] = []
+    _boosts.clear()
+    _boost_total = 0.0
+
+
+def add_corpse_boost(compost_system: dict, tick: int):
+    """Add a corpse boost. Every boost lasts the same time, so appending
+    keeps the running list ordered by expiry."""
+    global _boost_total
+    expires_at = tick + CORPSE_BOOST_DURATION
+    compost_system.setdefault("corpse_boosts", []).append({
+        "expires_at_tick": expires_at,
+        "bonus": CORPSE_NUTRIENT_BOOST
+    })
+    _boosts.append((expires_at, CORPSE_NUTRIENT_BOOST))
+    _boost_total += CORPSE_NUTRIENT_BOOST
+
+
+def expire_boosts(compost_system: dict, tick: int):
+    """Expire boosts from the running total and the saved list.
+
+    The Rust core expires the saved list itself before plugins run, so
+    its entries may already be gone; the running list's never are.
+    """
+    global _boost_total
+    if not _boosts or _boosts[0][0] > tick:
+        return
+    while _boosts and _boosts[0][0] <= tick:
+        _boost_total -= _boosts.popleft()[1]
+    if not _boosts:
+        _boost_total = 0.0  # Drop any float drift
+
+    saved = compost_system.get("corpse_boosts")
+    if saved:
+        saved[:] = [b for b in saved if b["expires_at_tick"] > tick]
+
+
+def process_undertakers(state: dict, compost_tile: dict, compost_system: dict) -> dict:
     """Process undertaker ants moving corpses."""
     if "graveyard" not in state:
         return state
 
     graveyard = state["graveyard"]
     corpses = graveyard.get("corpses", [])
-    compost_system = state["systems"].get("compost_heap", {})
-    compost_tile = state["map"]["tiles"].get("compost", {})
+    tick = state["tick"]
 
     # Skip if tile is blighted
     if compost_tile.get("blighted", False):
         return state
 
-    # Find undertaker ants
-    undertakers = [e for e in state["entities"]
-                   if e.get("type") == "ant" and e.get("role") == "undertaker"]
+    for undertaker in state.get("entities", []):
+        if undertaker.get("type") != "ant" or undertaker.get("role") != "undertaker":
+            continue
 
-    for undertaker in undertakers:
         # Check if undertaker is currently processing
         if undertaker.get("processing_corpse"):
             undertaker["processing_ticks"] = undertaker.get("processing_ticks", 0) + 1
 
             if undertaker["processing_ticks"] >= CORPSE_PROCESSING_TICKS:
                 # Corpse delivered to compost
-                corpse_boosts = compost_system.get("corpse_boosts", [])
-                corpse_boosts.append({
-                    "expires_at_tick": state["tick"] + CORPSE_BOOST_DURATION,
-                    "bonus": CORPSE_NUTRIENT_BOOST
-                })
-                compost_system["corpse_boosts"] = corpse_boosts
+                add_corpse_boost(compost_system, tick)
 
                 # Add contamination
                 compost_tile["contamination"] = compost_tile.get("contamination", 0) + CONTAMINATION_PER_CORPSE
@@ -70,7 +121,7 @@ def process_undertakers(state: dict) -> dict:
                 print(f"[undertaker] corpse processed, contamination now {compost_tile['contamination']:.1%}")
 
                 _bus.emit("corpse_processed", {
-                    "tick": state["tick"],
+                    "tick": tick,
                     "total_processed": graveyard["total_processed"],
                     "contamination": compost_tile["contamination"]
                 })
@@ -85,10 +136,9 @@ def process_undertakers(state: dict) -> dict:
     return state
 
 
-def process_contamination(state: dict) -> dict:
+def process_contamination(state: dict, compost_tile: dict, compost_system: dict) -> dict:
     """Check for blight events based on contamination."""
-    compost_tile = state["map"]["tiles"].get("compost", {})
-    compost_system = state["systems"].get("compost_heap", {})
+    tick = state["tick"]
 
     # Handle active blight
     if compost_tile.get("blighted", False):
@@ -98,7 +148,7 @@ def process_contamination(state: dict) -> dict:
             compost_tile["blighted"] = False
             compost_tile["contamination"] = 0  # Reset after blight
             print("[undertaker] blight has cleared from The Heap")
-            _bus.emit("blight_cleared", {"tick": state["tick"], "tile": "compost"})
+            _bus.emit("blight_cleared", {"tick": tick, "tile": "compost"})
 
         return state
 
@@ -109,26 +159,25 @@ def process_contamination(state: dict) -> dict:
         compost_tile["blighted"] = True
         compost_tile["blight_ticks_remaining"] = BLIGHT_DURATION
 
-        # Kill any ants on the tile
-        survivors = []
-        for entity in state["entities"]:
-            if entity.get("tile") == "compost":
+        # Kill any ants on the tile, culling the entity list in place
+        entities = state["entities"]
+        dead = [e for e in entities if e.get("tile") == "compost"]
+        if dead:
+            for entity in dead:
                 print(f"[undertaker] BLIGHT kills {entity.get('type')} {entity.get('id')} on The Heap")
                 _bus.emit("entity_died", {
                     "entity": entity,
                     "cause": "blight",
-                    "tick": state["tick"]
+                    "tick": tick
                 })
-            else:
-                survivors.append(entity)
-        state["entities"] = survivors
+            entities[:] = [e for e in entities if e.get("tile") != "compost"]
 
         # Clear corpse boosts
-        compost_system["corpse_boosts"] = []
+        clear_boosts(compost_system)
 
         print(f"[undertaker] BLIGHT EVENT on The Heap! Tile disabled for {BLIGHT_DURATION} ticks")
         _bus.emit("blight_struck", {
-            "tick": state["tick"],
+            "tick": tick,
             "tile": "compost",
             "contamination": contamination
         })
@@ -136,37 +185,28 @@ def process_contamination(state: dict) -> dict:
     return state
 
 
-def process_corpse_boosts(state: dict) -> dict:
+def process_corpse_boosts(state: dict, compost_tile: dict, compost_system: dict) -> dict:
     """Apply and expire corpse nutrient boosts."""
-    compost_system = state["systems"].get("compost_heap", {})
-    compost_tile = state["map"]["tiles"].get("compost", {})
+    tick = state["tick"]
 
     # Skip if blighted
     if compost_tile.get("blighted", False):
         return state
 
-    boosts = compost_system.get("corpse_boosts", [])
-    active_boosts = []
-    total_bonus = 0
-
-    for boost in boosts:
-        if boost["expires_at_tick"] > state["tick"]:
-            active_boosts.append(boost)
-            total_bonus += boost["bonus"]
+    if not _boosts:
+        return state
 
-    compost_system["corpse_boosts"] = active_boosts
+    expire_boosts(compost_system, tick)
 
     # Apply bonus nutrients
-    if total_bonus > 0:
-        state["resources"]["nutrients"] = state["resources"].get("nutrients", 0) + total_bonus
+    if _boost_total > 0:
+        state["resources"]["nutrients"] = state["resources"].get("nutrients", 0) + _boost_total
 
     return state
 
 
-def check_compost_disabled(state: dict) -> dict:
+def check_compost_disabled(state: dict, compost_tile: dict, compost_system: dict) -> dict:
     """Disable compost production during blight."""
-    compost_tile = state["map"]["tiles"].get("compost", {})
-    compost_system = state["systems"].get("compost_heap", {})
 
     if compost_tile.get("blighted", False):
         # Store original rates if not stored
@@ -185,17 +225,17 @@ def check_compost_disabled(state: dict) -> dict:
 
 
 def on_tick(payload: dict):
-    """Main tick handler for undertaker system."""
-    from engine.state import load_state, save_state
+    """Main tick handler for undertaker system. Mutates the live tick state."""
+    state = payload
 
-    state = load_state()
-
-    state = process_undertakers(state)
-    state = process_corpse_boosts(state)
-    state = process_contamination(state)
-    state = check_compost_disabled(state)
+    # Resolved once and shared by every step below
+    compost_tile = state["map"]["tiles"].get("compost", {})
+    compost_system = state["systems"].get("compost_heap", {})
 
-    save_state(state)
+    state = process_undertakers(state, compost_tile, compost_system)
+    state = process_corpse_boosts(state, compost_tile, compost_system)
+    state = process_contamination(state, compost_tile, compost_system)
+    state = check_compost_disabled(state, compost_tile, compost_system)
 
 
 def register(bus, state):
@@ -204,6 +244,7 @@ def register(bus, state):
     _bus = bus
     bus.register("entity_died", on_entity_died, PLUGIN_ID)
     bus.register("tick", on_tick, PLUGIN_ID)
+    sync_boosts(state.get("systems", {}).get("compost_heap", {}))
     print("[undertaker] The Undertaker's Gambit is active")
 
 
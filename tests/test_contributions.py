@@ -0,0 +1,51 @@
+"""Contributions: goals complete when every resource is paid, fractions included."""
+
+import unittest
+
+from engine.bus import EventBus
+from plugins import contributions
+
+
+def _state(cost):
+    return {
+        "tick": 1,
+        "resources": {"ore": 10, "crystals": 10},
+        "meta": {"goals": {"g": {"name": "Goal", "cost": dict(cost), "progress": {}}}},
+    }
+
+
+class FractionalContributionTest(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+        self.completed = []
+        self.bus.register("goal_complete", self.completed.append, "test")
+        contributions.register(self.bus, {})
+        # Keep the test off the real contributions file
+        self._drain_file = contributions._drain_file
+        contributions._drain_file = lambda: None
+
+    def tearDown(self):
+        contributions._drain_file = self._drain_file
+        contributions.unregister(self.bus)
+
+    def _contribute(self, state, *payments):
+        """Queue every (resource, amount) payment, then run one tick."""
+        for resource, amount in payments:
+            contributions._pending.append({"goal_id": "g", "resource": resource, "amount": amount})
+        self.bus.emit("tick", state)
+
+    def test_tenths_complete_goal(self):
+        state = _state({"ore": 0.6})
+        self._contribute(state, *[("ore", 0.1)] * 6)
+        self.assertTrue(state["meta"]["goals"]["g"].get("built"))
+        self.assertEqual(len(self.completed), 1)
+
+    def test_mixed_resources_complete_goal(self):
+        state = _state({"ore": 1, "crystals": 0.3})
+        self._contribute(state, ("ore", 1), ("crystals", 0.1), ("crystals", 0.2))
+        self.assertTrue(state["meta"]["goals"]["g"].get("built"))
+        self.assertEqual(len(self.completed), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
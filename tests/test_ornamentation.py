@@ -0,0 +1,70 @@
+"""Ornamentation: adorned ants stop generating influence once they die."""
+
+import unittest
+
+from engine.bus import EventBus
+from engine.tick import python_tick
+from plugins import ornamentation
+
+
+def _state():
+    return {
+        "tick": 1,
+        "resources": {"influence": 0},
+        "entities": [
+            {
+                "id": "a1",
+                "type": "ant",
+                "role": "worker",
+                "tile": "compost",
+                "hunger": 100,
+                "adorned": True,
+                "ornament": "gold_band",
+                "influence_rate": ornamentation.JEWELRY["gold_band"].influence_rate,
+            },
+        ],
+    }
+
+
+class DeadAdornedAntTest(unittest.TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+        self.state = _state()
+        ornamentation.register(self.bus, self.state)
+
+    def tearDown(self):
+        ornamentation.unregister(self.bus)
+        ornamentation._adorned.clear()
+
+    def _tick(self, events=()):
+        """Dispatch events and the tick the way engine.tick.run does."""
+        for event in events:
+            self.bus.emit(event.get("type", "unknown_event"), event)
+        self.bus.emit("tick", self.state)
+
+    def test_python_tick_death_stops_influence(self):
+        self.state, events = python_tick(self.state)
+        self._tick(events)
+        self.assertGreater(self.state["resources"]["influence"], 0)
+
+        self.state["entities"][0]["hunger"] = 0
+        self.state, events = python_tick(self.state)
+        before = self.state["resources"]["influence"]
+        self._tick(events)
+        self.assertEqual(self.state["resources"]["influence"], before)
+
+    def test_rust_shaped_death_stops_influence(self):
+        self._tick()
+        self.assertGreater(self.state["resources"]["influence"], 0)
+
+        # Rust core events are wrapped, so they reach the bus as
+        # unknown_event; the entity is simply gone from the next state.
+        self.state["tick"] += 1
+        self.state["entities"] = []
+        before = self.state["resources"]["influence"]
+        self._tick([{"tick": self.state["tick"], "kind": {"type": "BlightKill", "entity_id": "a1"}}])
+        self.assertEqual(self.state["resources"]["influence"], before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,8 @@ Usage:
     python view.py --rebuild # Force rebuild
 """
 
+import os
+import shutil
 import subprocess
 import sys
 import webbrowser
@@ -21,13 +23,37 @@ VIEWER_DIR = Path(__file__).parent / "viewer"
 DIST_DIR = VIEWER_DIR / "dist"
 
 
-def run_npm_build():
+def newest_mtime(root: Path) -> float:
+    """Latest mtime of any file under root, walked with os.scandir."""
+    newest = 0.0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    mtime = entry.stat(follow_symlinks=False).st_mtime
+                    if mtime > newest:
+                        newest = mtime
+    return newest
+
+
+def find_npm() -> str | None:
+    """Path to the npm executable, or None.
+
+    shutil.which honours PATHEXT, so on Windows this finds npm.cmd and
+    npm can be run without a shell.
+    """
+    return shutil.which("npm")
+
+
+def run_npm_build(npm: str):
     """Build the viewer with Vite."""
     print("[viewer] Building...")
     result = subprocess.run(
-        ["npm", "run", "build"],
+        [npm, "run", "build"],
         cwd=VIEWER_DIR,
-        shell=True  # Needed on Windows
     )
     if result.returncode != 0:
         print("[viewer] Build failed!")
@@ -35,32 +61,20 @@ def run_npm_build():
     print("[viewer] Build complete.")
 
 
-def check_npm_installed():
-    """Check if npm is available."""
-    try:
-        subprocess.run(
-            ["npm", "--version"],
-            capture_output=True,
-            shell=True
-        )
-        return True
-    except FileNotFoundError:
-        return False
-
-
 def main():
     args = sys.argv[1:]
     dev_mode = "--dev" in args
     force_rebuild = "--rebuild" in args
 
-    if not check_npm_installed():
+    npm = find_npm()
+    if npm is None:
         print("[viewer] Error: npm not found. Install Node.js first.")
         sys.exit(1)
 
     # Check if node_modules exists
     if not (VIEWER_DIR / "node_modules").exists():
         print("[viewer] Installing dependencies...")
-        subprocess.run(["npm", "install"], cwd=VIEWER_DIR, shell=True)
+        subprocess.run([npm, "install"], cwd=VIEWER_DIR)
 
     if dev_mode:
         # Dev mode: run Vite dev server + FastAPI in parallel
@@ -70,41 +84,38 @@ def main():
         print("[viewer] Use http://localhost:5173 for hot reload")
         print()
 
-        # Start FastAPI in background
-        import threading
-
-        def run_fastapi():
-            subprocess.run(
-                [sys.executable, "-m", "uvicorn", "viewer.server:app",
-                 "--port", "5000", "--reload"],
-                cwd=Path(__file__).parent
-            )
-
-        api_thread = threading.Thread(target=run_fastapi, daemon=True)
-        api_thread.start()
+        # Start Vite in background
+        vite = subprocess.Popen([npm, "run", "dev"], cwd=VIEWER_DIR)
 
-        # Give FastAPI a moment to start
-        time.sleep(1)
+        # Open browser once Vite has had a moment to start
+        def open_browser():
+            time.sleep(1)
+            webbrowser.open("http://localhost:5173")
 
-        # Open browser
-        webbrowser.open("http://localhost:5173")
+        import threading
+        threading.Thread(target=open_browser, daemon=True).start()
 
-        # Run Vite in foreground
-        subprocess.run(["npm", "run", "dev"], cwd=VIEWER_DIR, shell=True)
+        # Run FastAPI in the foreground. Reloading needs the import string,
+        # since uvicorn re-imports the app when server code changes.
+        import uvicorn
+        try:
+            uvicorn.run("viewer.server:app", port=5000, reload=True)
+        finally:
+            vite.terminate()
 
     else:
         # Production mode: build then serve
         if force_rebuild or not DIST_DIR.exists():
-            run_npm_build()
+            run_npm_build(npm)
         else:
             # Check if source is newer than build
             src_dir = VIEWER_DIR / "src"
             if src_dir.exists():
-                src_mtime = max(f.stat().st_mtime for f in src_dir.rglob("*") if f.is_file())
+                src_mtime = newest_mtime(src_dir)
                 dist_mtime = DIST_DIR.stat().st_mtime
                 if src_mtime > dist_mtime:
                     print("[viewer] Source changed, rebuilding...")
-                    run_npm_build()
+                    run_npm_build(npm)
 
         print("[viewer] Starting server...")
         print("[viewer] Open http://localhost:5000")
@@ -119,12 +130,10 @@ def main():
         import threading
         threading.Thread(target=open_browser, daemon=True).start()
 
-        # Run FastAPI server
-        subprocess.run(
-            [sys.executable, "-m", "uvicorn", "viewer.server:app",
-             "--host", "0.0.0.0", "--port", "5000"],
-            cwd=Path(__file__).parent
-        )
+        # Run FastAPI server in this process
+        import uvicorn
+        from viewer.server import app
+        uvicorn.run(app, host="0.0.0.0", port=5000)
 
 
 if __name__ == "__main__":
@@ -7,51 +7,165 @@ Or: uvicorn viewer.server:app --reload --port 5000
 
 import asyncio
 import json
+import os
+import threading
 import time
 from pathlib import Path
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from sse_starlette.sse import EventSourceResponse
 
+# Try orjson, fallback to stdlib json
+USE_ORJSON = True
+try:
+    import orjson
+except ImportError:
+    USE_ORJSON = False
+
 # Paths
 VIEWER_DIR = Path(__file__).parent
 PROJECT_DIR = VIEWER_DIR.parent
 STATE_FILE = PROJECT_DIR / "state" / "game.json"
 DECISIONS_FILE = PROJECT_DIR / "logs" / "decisions.jsonl"
-BLESSINGS_FILE = PROJECT_DIR / "state" / "blessings.json"
+BLESSINGS_FILE = PROJECT_DIR / "state" / "blessings.json"  # Pre-JSONL format
+BLESSINGS_LOG = BLESSINGS_FILE.with_suffix(".jsonl")
 DIST_DIR = VIEWER_DIR / "dist"
 
 
+def dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes."""
+    if USE_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def loads(data: bytes | str):
+    """Parse JSON bytes or text. Errors are json.JSONDecodeError either way."""
+    if USE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def load_state() -> dict | None:
     """Load current game state."""
     if STATE_FILE.exists():
         try:
-            with open(STATE_FILE, 'r') as f:
-                return json.load(f)
+            return loads(STATE_FILE.read_bytes())
         except (json.JSONDecodeError, IOError):
             pass
     return None
 
 
-def load_decisions(limit: int = 10) -> list:
-    """Load recent decisions from the JSONL log."""
-    if not DECISIONS_FILE.exists():
-        return []
+# Last parse of STATE_FILE, shared by /state and every /events client
+_state_cache = {"mtime": None, "data": None, "json": None}
+
+
+def get_cached_state() -> dict:
+    """Return the state cache, re-reading STATE_FILE only if its mtime moved.
+
+    "json" holds the state re-serialized compactly, ready to send.
+    """
+    try:
+        mtime = STATE_FILE.stat().st_mtime_ns
+    except OSError:
+        return _state_cache
+    if mtime != _state_cache["mtime"]:
+        try:
+            data = loads(STATE_FILE.read_bytes())
+        except (json.JSONDecodeError, IOError):
+            return _state_cache  # Keep the last good copy
+        _state_cache.update(mtime=mtime, data=data, json=dumps(data).decode())
+    return _state_cache
+
+
+# Bytes read from the end of DECISIONS_FILE on the first pass
+DECISIONS_TAIL_BYTES = 16384
+
+_decisions_cache = {"mtime": None, "limit": None, "decisions": []}
+
 
-    decisions = []
-    with open(DECISIONS_FILE, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line:
+def _read_tail(path: Path, limit: int) -> list:
+    """Parse the last `limit` records of a JSONL file, reading from the end.
+
+    Starts with the final DECISIONS_TAIL_BYTES and doubles the window until
+    enough complete lines are in it or the whole file has been read.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        window = DECISIONS_TAIL_BYTES
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            lines = f.read(size - start).splitlines()
+            if start > 0:
+                lines = lines[1:]  # First line may be cut off
+
+            records = []
+            for line in reversed(lines):
+                if not line.strip():
+                    continue
                 try:
-                    decisions.append(json.loads(line))
+                    records.append(loads(line))
                 except json.JSONDecodeError:
                     continue
+                if len(records) == limit:
+                    break
+
+            if len(records) == limit or start == 0:
+                records.reverse()
+                return records
+            window *= 2
 
-    return decisions[-limit:]
+
+def load_decisions(limit: int = 10) -> list:
+    """Load recent decisions from the JSONL log.
+
+    The result is cached until the file's mtime changes.
+    """
+    try:
+        mtime = DECISIONS_FILE.stat().st_mtime_ns
+    except OSError:
+        return []
+
+    cache = _decisions_cache
+    if cache["mtime"] != mtime or cache["limit"] != limit:
+        cache.update(mtime=mtime, limit=limit, decisions=_read_tail(DECISIONS_FILE, limit))
+    return cache["decisions"]
+
+
+# How often the publisher checks STATE_FILE for changes
+STATE_POLL_SECONDS = 0.5
+
+# Frames a slow /events client may fall behind before old ones are dropped
+SUBSCRIBER_QUEUE_SIZE = 4
+
+# One queue per connected /events client
+_subscribers: set[asyncio.Queue] = set()
+
+
+def publish(data: str):
+    """Hand a state frame to every subscriber, dropping a full queue's oldest."""
+    for queue in _subscribers:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(data)
+
+
+async def state_publisher():
+    """Poll STATE_FILE once for all clients and fan changes out to them."""
+    last_mtime = None
+    while True:
+        if _subscribers:
+            cached = await asyncio.to_thread(get_cached_state)
+            if cached["data"] and cached["mtime"] != last_mtime:
+                last_mtime = cached["mtime"]
+                publish(cached["json"])
+        await asyncio.sleep(STATE_POLL_SECONDS)
 
 
 @asynccontextmanager
@@ -66,25 +180,61 @@ async def lifespan(app: FastAPI):
 
     print("[viewer] Starting on http://localhost:5000")
     print("[viewer] Observers can click on the map to bless the colony")
+
+    publisher = asyncio.create_task(state_publisher())
     yield
+    publisher.cancel()
+
+
+class PlainEventsGZipMiddleware(GZipMiddleware):
+    """GZip responses except the /events stream.
+
+    A gzip stream buffers inside the compressor, which would hold SSE
+    frames back from the browser.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/events":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(PlainEventsGZipMiddleware, minimum_size=512)
+
+
+def file_etag(path: Path) -> str:
+    """Weak ETag from a file's mtime and size; "none" if it doesn't exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return 'W/"none"'
+    return f'W/"{st.st_mtime_ns}-{st.st_size}"'
+
+
+# Clients must revalidate, but an unchanged file costs them a bodiless 304
+REVALIDATE_HEADERS = {"Cache-Control": "no-cache"}
 
 
 @app.get("/state")
-async def get_state():
+async def get_state(request: Request):
     """Return current game state as JSON."""
-    state = load_state()
-    if state:
-        return JSONResponse(content=state)
-    return JSONResponse(content={"error": "no state"})
+    cached = await asyncio.to_thread(get_cached_state)
+    if not cached["data"]:
+        return JSONResponse(content={"error": "no state"})
+
+    etag = f'W/"{cached["mtime"]}"'
+    headers = {**REVALIDATE_HEADERS, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached["json"], media_type="application/json", headers=headers)
 
 
 @app.get("/decisions")
 async def get_decisions():
     """Return recent decisions as JSON array."""
-    decisions = load_decisions(limit=10)
+    decisions = await asyncio.to_thread(load_decisions, limit=10)
     return JSONResponse(content=decisions)
 
 
@@ -92,30 +242,101 @@ async def get_decisions():
 async def events(request: Request):
     """SSE endpoint for live state updates."""
     async def event_generator():
-        last_tick = -1
-        while True:
-            if await request.is_disconnected():
-                break
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+        # Start from the current state rather than waiting for a change
+        cached = await asyncio.to_thread(get_cached_state)
+        if cached["data"]:
+            queue.put_nowait(cached["json"])
 
-            state = load_state()
-            if state and state.get("tick", 0) != last_tick:
-                last_tick = state.get("tick", 0)
+        _subscribers.add(queue)
+        try:
+            while True:
+                data = await queue.get()
                 yield {
                     "event": "message",
-                    "data": json.dumps(state)
+                    "data": data
                 }
-
-            await asyncio.sleep(0.5)
+        finally:
+            _subscribers.discard(queue)
 
     return EventSourceResponse(event_generator())
 
 
+# Serializes appends to BLESSINGS_LOG within this process. The handlers
+# below do their file I/O in worker threads so the event loop stays free.
+_blessings_lock = asyncio.Lock()
+_blessings_total = None  # Running total_influence, seeded from the log on first use
+
+# Guards the one-time move of BLESSINGS_FILE into the log; reads run in
+# worker threads, so this is a thread lock rather than an asyncio one
+_migrate_lock = threading.Lock()
+_migrated = False
+
+
+def migrate_legacy_blessings():
+    """Move pending blessings from BLESSINGS_FILE into the log, then remove it."""
+    global _migrated
+    with _migrate_lock:
+        if _migrated:
+            return
+        try:
+            legacy = loads(BLESSINGS_FILE.read_bytes()).get("blessings", [])
+        except FileNotFoundError:
+            legacy = None
+        except json.JSONDecodeError:
+            legacy = []  # Unreadable; nothing to carry over
+        if legacy is not None:
+            if legacy:
+                append_blessings(b"".join(dumps(b) + b"\n" for b in legacy))
+            BLESSINGS_FILE.unlink(missing_ok=True)
+            print(f"[viewer] Migrated {len(legacy)} pending blessings to {BLESSINGS_LOG.name}")
+        _migrated = True
+
+
+def read_blessings() -> dict:
+    """Parse the blessings log line by line, summing influence as it goes."""
+    migrate_legacy_blessings()
+    pending = {"blessings": [], "total_influence": 0}
+    try:
+        with open(BLESSINGS_LOG, 'rb') as f:
+            for line in f:
+                try:
+                    blessing = loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn or blank line
+                pending["blessings"].append(blessing)
+                pending["total_influence"] += blessing.get("amount", 0)
+    except FileNotFoundError:
+        pass
+    return pending
+
+
+def append_blessings(lines: bytes):
+    """Append encoded blessing lines to the log."""
+    with open(BLESSINGS_LOG, 'ab') as f:
+        f.write(lines)
+
+
+def discard_blessings():
+    """Remove the blessings log. Renamed first so readers see either the
+    whole log or none of it."""
+    processing = BLESSINGS_LOG.with_suffix(".processing")
+    try:
+        os.replace(BLESSINGS_LOG, processing)
+        processing.unlink()
+    except FileNotFoundError:
+        pass
+
+
 @app.post("/bless")
 async def bless(request: Request):
     """
     Accept blessings from observers.
-    Blessings are accumulated and applied to game state by the tick engine.
+    Blessings are appended to a JSONL log and applied to game state by the
+    tick engine.
     """
+    global _blessings_total
     try:
         data = await request.json()
         blessings = data.get('blessings', [])
@@ -123,33 +344,28 @@ async def bless(request: Request):
         if not blessings:
             return JSONResponse(content={"status": "no_blessings"})
 
-        # Load existing blessings or create new
-        pending = {"blessings": [], "total_influence": 0}
-        if BLESSINGS_FILE.exists():
-            try:
-                with open(BLESSINGS_FILE, 'r') as f:
-                    pending = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        # Add new blessings
-        for b in blessings:
-            pending["blessings"].append({
+        now = time.time()
+        entries = [
+            {
                 "type": b.get("type", "touch"),
                 "tile_id": b.get("tileId"),
                 "amount": b.get("amount", 0.1),
-                "timestamp": time.time()
-            })
-            pending["total_influence"] += b.get("amount", 0.1)
-
-        # Save
-        with open(BLESSINGS_FILE, 'w') as f:
-            json.dump(pending, f)
+                "timestamp": now
+            }
+            for b in blessings
+        ]
+        lines = b"".join(dumps(e) + b"\n" for e in entries)
+
+        async with _blessings_lock:
+            if _blessings_total is None:
+                _blessings_total = (await asyncio.to_thread(read_blessings))["total_influence"]
+            await asyncio.to_thread(append_blessings, lines)
+            _blessings_total += sum(e["amount"] for e in entries)
 
         return JSONResponse(content={
             "status": "blessed",
             "count": len(blessings),
-            "total_pending": pending["total_influence"]
+            "total_pending": _blessings_total
         })
 
     except Exception as e:
@@ -160,27 +376,52 @@ async def bless(request: Request):
 
 
 @app.get("/blessings")
-async def get_blessings():
+async def get_blessings(request: Request):
     """Get pending blessings (for tick engine to consume)."""
-    if BLESSINGS_FILE.exists():
-        try:
-            with open(BLESSINGS_FILE, 'r') as f:
-                return JSONResponse(content=json.load(f))
-        except (json.JSONDecodeError, IOError):
-            pass
-    return JSONResponse(content={"blessings": [], "total_influence": 0})
+    await asyncio.to_thread(migrate_legacy_blessings)  # So the ETag covers it
+    etag = file_etag(BLESSINGS_LOG)
+    headers = {**REVALIDATE_HEADERS, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=await asyncio.to_thread(read_blessings), headers=headers)
 
 
 @app.post("/blessings/clear")
 async def clear_blessings():
     """Clear pending blessings after they've been applied."""
-    with open(BLESSINGS_FILE, 'w') as f:
-        json.dump({"blessings": [], "total_influence": 0}, f)
+    global _blessings_total
+    async with _blessings_lock:
+        await asyncio.to_thread(discard_blessings)
+        _blessings_total = 0
     return JSONResponse(content={"status": "cleared"})
 
 
 CONTRIBUTIONS_FILE = PROJECT_DIR / "state" / "contributions.json"
 
+# Serializes the read/modify/write of CONTRIBUTIONS_FILE across requests
+_contributions_lock = asyncio.Lock()
+
+
+def read_contributions() -> dict:
+    """Read the pending contributions file."""
+    if CONTRIBUTIONS_FILE.exists():
+        try:
+            return loads(CONTRIBUTIONS_FILE.read_bytes())
+        except (json.JSONDecodeError, IOError):
+            pass
+    return {"contributions": []}
+
+
+def queue_contribution(contrib: dict):
+    """Append a contribution to the pending file for the tick engine."""
+    pending = read_contributions()
+    pending["contributions"].append(contrib)
+
+    # Replace in one step so the tick loop never reads a partial write
+    temp_file = CONTRIBUTIONS_FILE.with_suffix('.viewer.tmp')
+    temp_file.write_bytes(dumps(pending))
+    os.replace(temp_file, CONTRIBUTIONS_FILE)
+
 
 @app.post("/contribute")
 async def contribute_to_goal(request: Request):
@@ -202,7 +443,7 @@ async def contribute_to_goal(request: Request):
             )
 
         # Validate goal exists
-        state = load_state()
+        state = await asyncio.to_thread(load_state)
         if not state:
             return JSONResponse(
                 content={"status": "error", "message": "no game state"},
@@ -232,23 +473,13 @@ async def contribute_to_goal(request: Request):
             )
 
         # Queue contribution for tick engine to process
-        pending = {"contributions": []}
-        if CONTRIBUTIONS_FILE.exists():
-            try:
-                with open(CONTRIBUTIONS_FILE, 'r') as f:
-                    pending = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-
-        pending["contributions"].append({
-            "goal_id": goal_id,
-            "resource": resource,
-            "amount": amount,
-            "timestamp": time.time()
-        })
-
-        with open(CONTRIBUTIONS_FILE, 'w') as f:
-            json.dump(pending, f)
+        async with _contributions_lock:
+            await asyncio.to_thread(queue_contribution, {
+                "goal_id": goal_id,
+                "resource": resource,
+                "amount": amount,
+                "timestamp": time.time()
+            })
 
         return JSONResponse(content={
             "status": "queued",
@@ -267,13 +498,7 @@ async def contribute_to_goal(request: Request):
 @app.get("/contributions")
 async def get_contributions():
     """Get pending contributions."""
-    if CONTRIBUTIONS_FILE.exists():
-        try:
-            with open(CONTRIBUTIONS_FILE, 'r') as f:
-                return JSONResponse(content=json.load(f))
-        except (json.JSONDecodeError, IOError):
-            pass
-    return JSONResponse(content={"contributions": []})
+    return JSONResponse(content=await asyncio.to_thread(read_contributions))
 
 
 # Mount static files LAST so API routes take precedence
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Watch for interesting events in the game."""
 
+import random
 import time
 import sys
+from collections import defaultdict
 
 sys.path.insert(0, '/home/user/langstons_anthill')
 from engine.state import load_state
@@ -22,8 +24,14 @@ def main():
             tick = state['tick']
             fungus = state['resources']['fungus']
             influence = state['resources']['influence']
-            ant_count = len([e for e in state['entities'] if e.get('type') == 'ant'])
-            visitor_count = len([e for e in state['entities'] if e.get('type') == 'visitor'])
+
+            # One pass over the entities, grouped by type
+            by_type = defaultdict(list)
+            for e in state['entities']:
+                by_type[e.get('type')].append(e)
+            ant_count = len(by_type['ant'])
+            visitors = by_type['visitor']
+            visitor_count = len(visitors)
 
             # Only print updates every 10 ticks
             if tick - prev_tick >= 10:
@@ -42,7 +50,6 @@ def main():
 
             # Alert on visitor arrival
             if visitor_count > prev_visitor_count:
-                visitors = [e for e in state['entities'] if e.get('type') == 'visitor']
                 for v in visitors:
                     print(f"\n👽 VISITOR ARRIVED at tick {tick}! Type: {v.get('subtype', 'unknown')}\n")
                 prev_visitor_count = visitor_count
@@ -52,7 +59,7 @@ def main():
                 print(f"\n👋 VISITOR DEPARTED at tick {tick}\n")
                 prev_visitor_count = visitor_count
 
-            time.sleep(1)
+            time.sleep(random.uniform(0.8, 1.2))
 
         except KeyboardInterrupt:
             print("\n\nWatcher stopped.")